@@ -1,8 +1,11 @@
 """ The ``data_source.base`` package ``base`` module. """
 
 from abc import ABC, abstractmethod
-from logging import Logger
-from typing import Optional
+from logging import INFO, Logger
+from os import PathLike
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Callable, Optional, Union
 
 
 class BaseDataSource(ABC):
@@ -45,6 +48,58 @@ class BaseDataSource(ABC):
 
         self.__logger = value
 
+    def _run_stage(
+            self,
+            stage_name: str,
+            data_source_name: str,
+            is_supported: Callable[[], bool],
+            stage_function: Callable[[], None]
+    ) -> None:
+        """
+        Run a stage of the data processing, logging its start, completion, and any errors.
+
+        :parameter stage_name: The name of the stage, for example `download`, `extraction`, or `formatting`.
+        :parameter data_source_name: The name of the data source used in the log messages.
+        :parameter is_supported: The function that indicates whether the stage is supported.
+        :parameter stage_function: The function that runs the stage.
+        """
+
+        try:
+            if is_supported():
+                if self.logger is not None and self.logger.isEnabledFor(INFO):
+                    self.logger.info(
+                        msg="The {stage_name:s} of the data from the {data_source:s} has been started.".format(
+                            stage_name=stage_name,
+                            data_source=data_source_name
+                        )
+                    )
+
+                stage_function()
+
+                if self.logger is not None and self.logger.isEnabledFor(INFO):
+                    self.logger.info(
+                        msg="The {stage_name:s} of the data from the {data_source:s} has been completed.".format(
+                            stage_name=stage_name,
+                            data_source=data_source_name
+                        )
+                    )
+
+            else:
+                raise ValueError(
+                    "The {stage_name:s} of the data from the {data_source:s} is not supported.".format(
+                        stage_name=stage_name,
+                        data_source=data_source_name
+                    )
+                )
+
+        except Exception as exception_handle:
+            if self.logger is not None:
+                self.logger.error(
+                    msg=exception_handle
+                )
+
+            raise
+
     @abstractmethod
     def download(
             self,
@@ -65,3 +120,101 @@ class BaseDataSource(ABC):
             **kwargs
     ) -> None:
         """ Format the data from the data source. """
+
+    def _prepare_resume_directory(
+            self,
+            resume_directory_path: Union[str, PathLike[str]]
+    ) -> None:
+        """
+        Prepare the directory where the data should be downloaded and extracted instead of a temporary directory.
+
+        :parameter resume_directory_path: The path to the directory where the data should be downloaded and extracted.
+        """
+
+        Path(resume_directory_path).mkdir(
+            parents=True,
+            exist_ok=True
+        )
+
+        if self.logger is not None and self.logger.isEnabledFor(INFO):
+            self.logger.info(
+                msg="The data is downloaded and extracted into the '{directory_path:s}' directory.".format(
+                    directory_path=str(resume_directory_path)
+                )
+            )
+
+    def _run_pipeline_stages(
+            self,
+            intermediate_directory_path: Union[str, PathLike[str]],
+            output_directory_path: Union[str, PathLike[str]],
+            **kwargs
+    ) -> None:
+        """
+        Download, extract, and format the data from the data source one stage after another.
+
+        :parameter intermediate_directory_path: The path to the directory where the data should be downloaded and
+            extracted.
+        :parameter output_directory_path: The path to the output directory where the data should be formatted.
+        :parameter kwargs: The keyword arguments for the adjustment of the following underlying methods:
+            { `download`, `extract`, `format` }.
+        """
+
+        self.download(
+            output_directory_path=intermediate_directory_path,
+            **kwargs
+        )
+
+        self.extract(
+            input_directory_path=intermediate_directory_path,
+            output_directory_path=intermediate_directory_path,
+            **kwargs
+        )
+
+        self.format(
+            input_directory_path=intermediate_directory_path,
+            output_directory_path=output_directory_path,
+            **kwargs
+        )
+
+    def run_pipeline(
+            self,
+            output_directory_path: Union[str, PathLike[str]],
+            resume_directory_path: Optional[Union[str, PathLike[str]]] = None,
+            **kwargs
+    ) -> None:
+        """
+        Download, extract, and format the data from the data source.
+
+        The stages are run one after another using a temporary directory inside of the output directory. The data
+        sources that can overlap the stages should override the `_run_pipeline_stages` method, and the data sources that
+        can stream the downloaded data directly into the formatting should override this method.
+
+        :parameter output_directory_path: The path to the output directory where the data should be formatted.
+        :parameter resume_directory_path: The path to the directory where the data should be downloaded and extracted
+            instead of the temporary directory. The directory is kept after the pipeline, so that an interrupted
+            pipeline can be run again with the same directory and the already downloaded files are skipped or resumed.
+            The value `None` indicates that the temporary directory should be utilized.
+        :parameter kwargs: The keyword arguments for the adjustment of the following underlying methods:
+            { `download`, `extract`, `format` }.
+        """
+
+        if resume_directory_path is not None:
+            self._prepare_resume_directory(
+                resume_directory_path=resume_directory_path
+            )
+
+            self._run_pipeline_stages(
+                intermediate_directory_path=resume_directory_path,
+                output_directory_path=output_directory_path,
+                **kwargs
+            )
+
+        else:
+            with TemporaryDirectory(
+                dir=output_directory_path
+            ) as temporary_output_directory_path:
+                self._run_pipeline_stages(
+                    intermediate_directory_path=temporary_output_directory_path,
+                    output_directory_path=output_directory_path,
+                    **kwargs
+                )
@@ -1,3 +1,7 @@
 """ The ``data_source.base.utility`` package initialization module. """
 
 from data_source.base.utility.download import BaseDataSourceDownloadUtility
+
+from data_source.base.utility.extraction import BaseDataSourceExtractionUtility
+
+from data_source.base.utility.formatting import BaseDataSourceFormattingUtility
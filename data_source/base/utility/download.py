@@ -1,20 +1,261 @@
 """ The ``data_source.base.utility`` package ``download`` module. """
 
-from functools import partial
-from os import PathLike
+import sys
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from io import RawIOBase
+from os import SEEK_SET, PathLike, lseek, write
 from pathlib import Path
-from shutil import copyfileobj
-from typing import Union
+from queue import Full, Queue
+from threading import Event, Lock, Thread
+from time import sleep
+from typing import BinaryIO, Iterable, Iterator, Optional, Tuple, Union
 
-from requests.api import get
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ChunkedEncodingError, ConnectionError as HTTPConnectionError, RequestException, Timeout
 from requests.models import Response
+from requests.sessions import Session
+
+from urllib3.exceptions import ProtocolError, ReadTimeoutError
+from urllib3.util.retry import Retry
 
 from tqdm.auto import tqdm
 
+try:
+    from os import pwrite
+
+except ImportError:
+    pwrite = None
+
+
+DOWNLOAD_BUFFER_SIZE = 1 << 20
+
+DOWNLOAD_CHUNK_SIZE = 1 << 17
+
+DOWNLOAD_WRITE_BUFFER_SIZE = 1 << 23
+
+PARALLEL_DOWNLOAD_MINIMUM_FILE_SIZE = 1 << 25
+
+PROGRESS_BAR_MINIMUM_INTERVAL = 1.0
+
+HTTP_CONNECTION_POOL_MAXIMUM_SIZE = 32
+
+# The connect and read timeouts of the HTTP requests, so that a stalled connection raises an error which is retried
+# instead of blocking the download forever.
+HTTP_REQUEST_TIMEOUT = (10.0, 60.0)
+
+PARALLEL_DOWNLOAD_NUMBER_OF_RANGES = 8
+
+CONCURRENT_DOWNLOAD_NUMBER_OF_FILES = 8
+
+DOWNLOAD_MAXIMUM_NUMBER_OF_ATTEMPTS = 5
+
+DOWNLOAD_RETRY_BACKOFF_FACTOR = 1.5
+
+# The errors that interrupt a transfer which is already in progress, and which are not retried by the HTTP session.
+TRANSIENT_DOWNLOAD_ERRORS = (
+    ChunkedEncodingError,
+    HTTPConnectionError,
+    ProtocolError,
+    ReadTimeoutError,
+    Timeout,
+)
+
+PREFETCH_MAXIMUM_NUMBER_OF_CHUNKS = 8
+
+PREFETCH_QUEUE_TIMEOUT = 0.1
+
+# The lock that serializes the positioned writes of the byte ranges where the `os.pwrite` function is not available.
+_FILE_WRITE_LOCK = Lock()
+
+
+def _create_http_session() -> Session:
+    """
+    Create an HTTP session that reuses the connections and retries the failed HTTP requests.
+
+    :returns: The HTTP session.
+    """
+
+    http_session = Session()
+
+    http_adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=HTTP_CONNECTION_POOL_MAXIMUM_SIZE,
+        max_retries=Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504]
+        )
+    )
+
+    http_session.mount(
+        prefix="http://",
+        adapter=http_adapter
+    )
+
+    http_session.mount(
+        prefix="https://",
+        adapter=http_adapter
+    )
+
+    return http_session
+
+
+class _PrefetchedFileStream(RawIOBase):
+    """ The stream of a file whose chunks are read ahead by a background thread. """
+
+    def __init__(
+            self,
+            file_handle: BinaryIO,
+            chunk_size: int,
+            maximum_number_of_chunks: int
+    ) -> None:
+        """
+        The constructor method of the class.
+
+        :parameter file_handle: The handle of the file stream.
+        :parameter chunk_size: The size of the chunks that should be read ahead.
+        :parameter maximum_number_of_chunks: The maximum number of chunks that should be read ahead.
+        """
+
+        super().__init__()
+
+        self.__file_handle = file_handle
+        self.__chunk_size = chunk_size
+
+        self.__chunks = Queue(
+            maxsize=maximum_number_of_chunks
+        )
+
+        self.__chunk_view = memoryview(b"")
+        self.__is_exhausted = False
+        self.__is_stopped = Event()
+
+        self.__thread = Thread(
+            target=self.__read_chunks,
+            daemon=True
+        )
+
+        self.__thread.start()
+
+    def __put_chunk(
+            self,
+            chunk: Union[bytes, BaseException]
+    ) -> bool:
+        """
+        Put a chunk into the queue unless the stream is closed in the meantime.
+
+        :parameter chunk: The chunk of the file or the exception raised while reading it.
+
+        :returns: The indicator of whether the chunk is put into the queue.
+        """
+
+        while not self.__is_stopped.is_set():
+            try:
+                self.__chunks.put(
+                    item=chunk,
+                    timeout=PREFETCH_QUEUE_TIMEOUT
+                )
+
+                return True
+
+            except Full:
+                continue
+
+        return False
+
+    def __read_chunks(
+            self
+    ) -> None:
+        """ Read the chunks of the file until the end of the file, which is marked with an empty chunk. """
+
+        try:
+            while True:
+                chunk = self.__file_handle.read(self.__chunk_size)
+
+                if not self.__put_chunk(
+                    chunk=chunk
+                ) or not chunk:
+                    break
+
+        except BaseException as exception_handle:
+            self.__put_chunk(
+                chunk=exception_handle
+            )
+
+    def readable(
+            self
+    ) -> bool:
+        """
+        Get the indicator of whether the stream can be read.
+
+        :returns: The indicator of whether the stream can be read.
+        """
+
+        return True
+
+    def readinto(
+            self,
+            buffer: Union[bytearray, memoryview]
+    ) -> int:
+        """
+        Read the next bytes of the stream into a buffer.
+
+        :parameter buffer: The buffer.
+
+        :returns: The number of bytes read into the buffer. The value `0` indicates the end of the stream.
+        """
+
+        if not self.__chunk_view:
+            if self.__is_exhausted:
+                return 0
+
+            chunk = self.__chunks.get()
+
+            if isinstance(chunk, BaseException):
+                self.__is_exhausted = True
+
+                raise chunk
+
+            if not chunk:
+                self.__is_exhausted = True
+
+                return 0
+
+            self.__chunk_view = memoryview(chunk)
+
+        number_of_bytes = min(len(buffer), len(self.__chunk_view))
+
+        buffer[:number_of_bytes] = self.__chunk_view[:number_of_bytes]
+
+        self.__chunk_view = self.__chunk_view[number_of_bytes:]
+
+        return number_of_bytes
+
+    def close(
+            self
+    ) -> None:
+        """ Close the stream and wait for the background thread to stop. """
+
+        self.__is_stopped.set()
+        self.__thread.join()
+
+        super().close()
+
 
 class BaseDataSourceDownloadUtility:
     """ The base data source download utility class. """
 
+    _http_session = _create_http_session()
+
+    @staticmethod
+    def close_http_session() -> None:
+        """ Close the pooled connections of the shared HTTP session. """
+
+        BaseDataSourceDownloadUtility._http_session.close()
+
     @staticmethod
     def send_http_get_request(
             http_get_request_url: str,
@@ -23,14 +264,18 @@ class BaseDataSourceDownloadUtility:
         """
         Send an HTTP GET request.
 
+        The default connect and read timeouts are applied unless the `timeout` keyword argument is specified.
+
         :parameter http_get_request_url: The URL of the HTTP GET request.
         :parameter kwargs: The keyword arguments for the adjustment of the following underlying functions:
-            { `requests.api.get` }.
+            { `requests.sessions.Session.get` }.
 
         :returns: The response to the HTTP GET request.
         """
 
-        http_get_request_response = get(
+        kwargs.setdefault("timeout", HTTP_REQUEST_TIMEOUT)
+
+        http_get_request_response = BaseDataSourceDownloadUtility._http_session.get(
             url=http_get_request_url,
             **kwargs
         )
@@ -40,17 +285,44 @@ class BaseDataSourceDownloadUtility:
         return http_get_request_response
 
     @staticmethod
-    def download_file(
+    def _get_file_size(
+            http_request_response: Response
+    ) -> Optional[int]:
+        """
+        Get the size of a file from the response to an HTTP request.
+
+        :parameter http_request_response: The response to the HTTP request.
+
+        :returns: The size of the file. The value `None` indicates that the size of the file is not available.
+        """
+
+        file_size = http_request_response.headers.get("Content-Length", None)
+
+        if file_size is not None and file_size.isdigit():
+            file_size = int(file_size)
+
+        else:
+            file_size = None
+
+        return file_size
+
+    @staticmethod
+    @contextmanager
+    def open_file_stream(
             file_url: str,
-            file_name: str,
-            output_directory_path: Union[str, PathLike[str]]
-    ) -> None:
+            file_name: str
+    ) -> Iterator[BinaryIO]:
         """
-        Download a file.
+        Open a stream of a file without downloading it.
+
+        The progress of the stream is only displayed if the standard error stream is attached to a terminal. The
+        standard error stream is looked up whenever a stream is opened, since it can be replaced or missing, for example
+        under the `pythonw` interpreter.
 
         :parameter file_url: The URL of the file.
         :parameter file_name: The name of the file.
-        :parameter output_directory_path: The path to the output directory where the file should be downloaded.
+
+        :returns: The handle of the file stream.
         """
 
         http_get_request_response = BaseDataSourceDownloadUtility.send_http_get_request(
@@ -58,35 +330,510 @@ class BaseDataSourceDownloadUtility:
             stream=True
         )
 
-        http_get_request_response.raw.read = partial(
-            http_get_request_response.raw.read,
-            decode_content=True
+        http_get_request_response.raw.decode_content = True
+
+        with http_get_request_response:
+            if sys.stderr is None or not sys.stderr.isatty():
+                yield http_get_request_response.raw
+
+            else:
+                with tqdm.wrapattr(
+                    stream=http_get_request_response.raw,
+                    method="read",
+                    total=BaseDataSourceDownloadUtility._get_file_size(
+                        http_request_response=http_get_request_response
+                    ),
+                    desc="Streaming the '{file_name:s}' file".format(
+                        file_name=file_name
+                    ),
+                    ncols=150,
+                    mininterval=PROGRESS_BAR_MINIMUM_INTERVAL
+                ) as file_stream_handle:
+                    yield file_stream_handle
+
+    @staticmethod
+    @contextmanager
+    def prefetch_file_stream(
+            file_handle: BinaryIO,
+            chunk_size: int = DOWNLOAD_BUFFER_SIZE,
+            maximum_number_of_chunks: int = PREFETCH_MAXIMUM_NUMBER_OF_CHUNKS
+    ) -> Iterator[BinaryIO]:
+        """
+        Read a file stream ahead in a background thread, so that its transfer overlaps with its processing.
+
+        :parameter file_handle: The handle of the file stream.
+        :parameter chunk_size: The size of the chunks that should be read ahead.
+        :parameter maximum_number_of_chunks: The maximum number of chunks that should be read ahead.
+
+        :returns: The handle of the prefetched file stream.
+        """
+
+        with _PrefetchedFileStream(
+            file_handle=file_handle,
+            chunk_size=chunk_size,
+            maximum_number_of_chunks=maximum_number_of_chunks
+        ) as prefetched_file_stream_handle:
+            yield prefetched_file_stream_handle
+
+    @staticmethod
+    def _read_response_chunks(
+            http_get_request_response: Response
+    ) -> Iterator[memoryview]:
+        """
+        Read the content of the response to an HTTP GET request into a single reused buffer chunk by chunk.
+
+        Each chunk is only valid until the next one is read.
+
+        :parameter http_get_request_response: The streamed response to the HTTP GET request.
+
+        :returns: The views of the buffer holding the chunks of the content.
+        """
+
+        http_get_request_response.raw.decode_content = True
+
+        buffer = bytearray(DOWNLOAD_CHUNK_SIZE)
+
+        buffer_view = memoryview(buffer)
+
+        while True:
+            number_of_bytes = http_get_request_response.raw.readinto(buffer)
+
+            if number_of_bytes == 0:
+                break
+
+            yield buffer_view[:number_of_bytes]
+
+    @staticmethod
+    def _download_file_sequentially(
+            file_url: str,
+            file_name: str,
+            file_path: Path,
+            range_start: int = 0,
+            write_buffer_size: int = DOWNLOAD_WRITE_BUFFER_SIZE,
+            show_progress_bar: bool = True
+    ) -> None:
+        """
+        Download a file using a single HTTP GET request.
+
+        :parameter file_url: The URL of the file.
+        :parameter file_name: The name of the file.
+        :parameter file_path: The path to the file where the data should be downloaded.
+        :parameter range_start: The first byte of the file that should be downloaded. The value larger than `0`
+            indicates that the download of the already partially downloaded file should be resumed.
+        :parameter write_buffer_size: The size of the buffer through which the chunks are written to the file.
+        :parameter show_progress_bar: The indicator of whether the progress of the download should be displayed.
+        """
+
+        if range_start > 0:
+            http_get_request_response = BaseDataSourceDownloadUtility.send_http_get_request(
+                http_get_request_url=file_url,
+                headers={
+                    "Accept-Encoding": "identity",
+                    "Range": "bytes={range_start:d}-".format(
+                        range_start=range_start
+                    ),
+                },
+                stream=True
+            )
+
+            if http_get_request_response.status_code != 206:
+                range_start = 0
+
+        else:
+            http_get_request_response = BaseDataSourceDownloadUtility.send_http_get_request(
+                http_get_request_url=file_url,
+                stream=True
+            )
+
+        file_size = BaseDataSourceDownloadUtility._get_file_size(
+            http_request_response=http_get_request_response
         )
 
-        # noinspection PyBroadException
-        try:
-            file_size = http_get_request_response.headers.get("Content-Length", None)
+        with tqdm(
+            total=file_size + range_start if file_size is not None else None,
+            initial=range_start,
+            desc="Downloading the '{file_name:s}' file".format(
+                file_name=file_name
+            ),
+            ncols=150,
+            mininterval=PROGRESS_BAR_MINIMUM_INTERVAL,
+            disable=None if show_progress_bar else True,
+            unit="B",
+            unit_scale=True,
+            unit_divisor=1024
+        ) as progress_bar:
+            with file_path.open(
+                mode="ab" if range_start > 0 else "wb",
+                buffering=write_buffer_size
+            ) as destination_file_handle:
+                for file_chunk in BaseDataSourceDownloadUtility._read_response_chunks(
+                    http_get_request_response=http_get_request_response
+                ):
+                    destination_file_handle.write(
+                        file_chunk
+                    )
 
-            if file_size is not None:
-                file_size = float(file_size)
+                    progress_bar.update(
+                        n=len(file_chunk)
+                    )
 
-        except:
-            file_size = None
+    @staticmethod
+    def _download_file_sequentially_with_retries(
+            file_url: str,
+            file_name: str,
+            file_path: Path,
+            range_start: int = 0,
+            are_ranges_supported: bool = False,
+            write_buffer_size: int = DOWNLOAD_WRITE_BUFFER_SIZE,
+            show_progress_bar: bool = True
+    ) -> None:
+        """
+        Download a file using a single HTTP GET request, which is sent again if the transfer is interrupted.
+
+        The interrupted transfer is resumed from the already downloaded part of the file if the server supports the HTTP
+        GET range requests, and restarted otherwise.
+
+        :parameter file_url: The URL of the file.
+        :parameter file_name: The name of the file.
+        :parameter file_path: The path to the file where the data should be downloaded.
+        :parameter range_start: The first byte of the file that should be downloaded.
+        :parameter are_ranges_supported: The indicator of whether the server supports the HTTP GET range requests.
+        :parameter write_buffer_size: The size of the buffer through which the chunks are written to the file.
+        :parameter show_progress_bar: The indicator of whether the progress of the download should be displayed.
+        """
+
+        for attempt_index in range(DOWNLOAD_MAXIMUM_NUMBER_OF_ATTEMPTS):
+            try:
+                BaseDataSourceDownloadUtility._download_file_sequentially(
+                    file_url=file_url,
+                    file_name=file_name,
+                    file_path=file_path,
+                    range_start=range_start,
+                    write_buffer_size=write_buffer_size,
+                    show_progress_bar=show_progress_bar
+                )
+
+                return
+
+            except TRANSIENT_DOWNLOAD_ERRORS:
+                if attempt_index == DOWNLOAD_MAXIMUM_NUMBER_OF_ATTEMPTS - 1:
+                    raise
+
+                sleep(DOWNLOAD_RETRY_BACKOFF_FACTOR * 2 ** attempt_index)
+
+                range_start = file_path.stat().st_size if are_ranges_supported and file_path.is_file() else 0
+
+    @staticmethod
+    def _write_file_chunk(
+            file_descriptor: int,
+            file_chunk: memoryview,
+            file_offset: int
+    ) -> None:
+        """
+        Write a chunk of a file at an offset without moving the shared position of the file descriptor.
+
+        The `os.pwrite` function is used if available, and the file descriptor is otherwise positioned and written to
+        under a lock, since the platforms such as Windows do not provide it.
+
+        :parameter file_descriptor: The descriptor of the file where the chunk should be written.
+        :parameter file_chunk: The chunk of the file.
+        :parameter file_offset: The offset in the file where the chunk should be written.
+        """
+
+        if pwrite is not None:
+            pwrite(file_descriptor, file_chunk, file_offset)
+
+        else:
+            with _FILE_WRITE_LOCK:
+                lseek(file_descriptor, file_offset, SEEK_SET)
+                write(file_descriptor, file_chunk)
+
+    @staticmethod
+    def _download_file_range(
+            file_url: str,
+            file_descriptor: int,
+            range_start: int,
+            range_end: int,
+            progress_bar: tqdm
+    ) -> None:
+        """
+        Download a byte range of a file using a single HTTP GET range request.
+
+        :parameter file_url: The URL of the file.
+        :parameter file_descriptor: The descriptor of the file where the byte range should be written.
+        :parameter range_start: The first byte of the range.
+        :parameter range_end: The last byte of the range.
+        :parameter progress_bar: The shared progress bar of the download.
+        """
+
+        file_offset = range_start
+
+        for attempt_index in range(DOWNLOAD_MAXIMUM_NUMBER_OF_ATTEMPTS):
+            try:
+                http_get_request_response = BaseDataSourceDownloadUtility.send_http_get_request(
+                    http_get_request_url=file_url,
+                    headers={
+                        "Accept-Encoding": "identity",
+                        "Range": "bytes={range_start:d}-{range_end:d}".format(
+                            range_start=file_offset,
+                            range_end=range_end
+                        ),
+                    },
+                    stream=True
+                )
+
+                with http_get_request_response:
+                    if http_get_request_response.status_code != 206:
+                        raise ValueError(
+                            "The HTTP GET range request for the '{file_url:s}' file has not been fulfilled.".format(
+                                file_url=file_url
+                            )
+                        )
+
+                    for file_chunk in BaseDataSourceDownloadUtility._read_response_chunks(
+                        http_get_request_response=http_get_request_response
+                    ):
+                        BaseDataSourceDownloadUtility._write_file_chunk(
+                            file_descriptor=file_descriptor,
+                            file_chunk=file_chunk,
+                            file_offset=file_offset
+                        )
+
+                        file_offset += len(file_chunk)
 
-        with tqdm.wrapattr(
-            stream=http_get_request_response.raw,
-            method="read",
+                        progress_bar.update(
+                            n=len(file_chunk)
+                        )
+
+                return
+
+            # The rest of the byte range is requested again, starting from the first byte that has not been written.
+            except TRANSIENT_DOWNLOAD_ERRORS:
+                if attempt_index == DOWNLOAD_MAXIMUM_NUMBER_OF_ATTEMPTS - 1:
+                    raise
+
+                sleep(DOWNLOAD_RETRY_BACKOFF_FACTOR * 2 ** attempt_index)
+
+    @staticmethod
+    def _download_file_in_parallel(
+            file_url: str,
+            file_name: str,
+            file_path: Path,
+            file_size: int,
+            number_of_ranges: int = PARALLEL_DOWNLOAD_NUMBER_OF_RANGES,
+            show_progress_bar: bool = True
+    ) -> None:
+        """
+        Download a file using multiple concurrent HTTP GET range requests.
+
+        The byte ranges are written into a partial file, which replaces the file only once all of them are downloaded.
+
+        :parameter file_url: The URL of the file.
+        :parameter file_name: The name of the file.
+        :parameter file_path: The path to the file where the data should be downloaded.
+        :parameter file_size: The size of the file.
+        :parameter number_of_ranges: The number of the byte ranges that should be downloaded concurrently.
+        :parameter show_progress_bar: The indicator of whether the progress of the download should be displayed.
+        """
+
+        range_size = -(-file_size // number_of_ranges)
+
+        partial_file_path = file_path.with_name(
+            "{file_name:s}.part".format(
+                file_name=file_path.name
+            )
+        )
+
+        with tqdm(
             total=file_size,
             desc="Downloading the '{file_name:s}' file".format(
                 file_name=file_name
             ),
-            ncols=150
-        ) as file_download_stream_handle:
-            with Path(output_directory_path, file_name).open(
-                mode="wb"
+            ncols=150,
+            mininterval=PROGRESS_BAR_MINIMUM_INTERVAL,
+            disable=None if show_progress_bar else True,
+            unit="B",
+            unit_scale=True,
+            unit_divisor=1024
+        ) as progress_bar:
+            with partial_file_path.open(
+                mode="wb",
+                buffering=0
             ) as destination_file_handle:
-                # noinspection PyTypeChecker
-                copyfileobj(
-                    fsrc=file_download_stream_handle,
-                    fdst=destination_file_handle
+                destination_file_handle.truncate(
+                    file_size
                 )
+
+                with ThreadPoolExecutor(
+                    max_workers=number_of_ranges
+                ) as thread_pool_executor:
+                    futures = [
+                        thread_pool_executor.submit(
+                            BaseDataSourceDownloadUtility._download_file_range,
+                            file_url=file_url,
+                            file_descriptor=destination_file_handle.fileno(),
+                            range_start=range_start,
+                            range_end=min(range_start + range_size, file_size) - 1,
+                            progress_bar=progress_bar
+                        ) for range_start in range(0, file_size, range_size)
+                    ]
+
+                    for future in futures:
+                        future.result()
+
+        partial_file_path.replace(
+            target=file_path
+        )
+
+    @staticmethod
+    def download_file(
+            file_url: str,
+            file_name: str,
+            output_directory_path: Union[str, PathLike[str]],
+            force: bool = False,
+            write_buffer_size: int = DOWNLOAD_WRITE_BUFFER_SIZE,
+            number_of_ranges: int = PARALLEL_DOWNLOAD_NUMBER_OF_RANGES,
+            show_progress_bar: bool = True
+    ) -> None:
+        """
+        Download a file.
+
+        The file that is already downloaded and not modified since is skipped, and the file that is only partially
+        downloaded is resumed if the server supports it. The large files are downloaded using multiple concurrent HTTP
+        GET range requests if the server supports them. If the HTTP HEAD request fails, the file is downloaded using a
+        single HTTP GET request.
+
+        :parameter file_url: The URL of the file.
+        :parameter file_name: The name of the file.
+        :parameter output_directory_path: The path to the output directory where the file should be downloaded.
+        :parameter force: The indicator of whether the file should be downloaded again even if it is already downloaded.
+        :parameter write_buffer_size: The size of the buffer through which the chunks are written to the file, if it is
+            downloaded using a single HTTP GET request.
+        :parameter number_of_ranges: The number of the byte ranges that should be downloaded concurrently, if the file
+            is downloaded using multiple concurrent HTTP GET range requests.
+        :parameter show_progress_bar: The indicator of whether the progress of the download should be displayed.
+        """
+
+        file_path = Path(output_directory_path, file_name)
+
+        try:
+            http_head_request_response = BaseDataSourceDownloadUtility._http_session.head(
+                url=file_url,
+                allow_redirects=True,
+                headers={
+                    "Accept-Encoding": "identity",
+                },
+                timeout=HTTP_REQUEST_TIMEOUT
+            )
+
+        except RequestException:
+            http_head_request_response = None
+
+        if http_head_request_response is not None and http_head_request_response.ok:
+            file_size = BaseDataSourceDownloadUtility._get_file_size(
+                http_request_response=http_head_request_response
+            )
+
+            are_ranges_supported = http_head_request_response.headers.get("Accept-Ranges", None) == "bytes"
+
+        else:
+            file_size, are_ranges_supported = None, False
+
+        if not force and file_size is not None and file_path.is_file():
+            local_file_stat = file_path.stat()
+
+            last_modified = http_head_request_response.headers.get("Last-Modified", None)
+
+            try:
+                is_local_file_up_to_date = last_modified is None or \
+                    local_file_stat.st_mtime >= parsedate_to_datetime(last_modified).timestamp()
+
+            except (TypeError, ValueError):
+                is_local_file_up_to_date = False
+
+            if is_local_file_up_to_date:
+                if local_file_stat.st_size == file_size:
+                    return
+
+                if 0 < local_file_stat.st_size < file_size and are_ranges_supported:
+                    BaseDataSourceDownloadUtility._download_file_sequentially_with_retries(
+                        file_url=file_url,
+                        file_name=file_name,
+                        file_path=file_path,
+                        range_start=local_file_stat.st_size,
+                        are_ranges_supported=are_ranges_supported,
+                        write_buffer_size=write_buffer_size,
+                        show_progress_bar=show_progress_bar
+                    )
+
+                    return
+
+        if file_size is not None and file_size >= PARALLEL_DOWNLOAD_MINIMUM_FILE_SIZE and are_ranges_supported and \
+                number_of_ranges > 1:
+            BaseDataSourceDownloadUtility._download_file_in_parallel(
+                file_url=file_url,
+                file_name=file_name,
+                file_path=file_path,
+                file_size=file_size,
+                number_of_ranges=number_of_ranges,
+                show_progress_bar=show_progress_bar
+            )
+
+        else:
+            BaseDataSourceDownloadUtility._download_file_sequentially_with_retries(
+                file_url=file_url,
+                file_name=file_name,
+                file_path=file_path,
+                are_ranges_supported=are_ranges_supported,
+                write_buffer_size=write_buffer_size,
+                show_progress_bar=show_progress_bar
+            )
+
+    @staticmethod
+    def download_files(
+            file_urls_and_names: Iterable[Tuple[str, str]],
+            output_directory_path: Union[str, PathLike[str]],
+            number_of_threads: int = CONCURRENT_DOWNLOAD_NUMBER_OF_FILES
+    ) -> None:
+        """
+        Download multiple files concurrently.
+
+        The files are downloaded through the shared HTTP session, so the connections to the same host are reused. The
+        number of the byte ranges of each of the large files is reduced, so that the concurrent downloads do not open
+        more connections than the HTTP session pools. Only the overall progress of the downloads is displayed, since
+        the progress bars of the concurrent downloads would overwrite each other.
+
+        :parameter file_urls_and_names: The URLs and names of the files.
+        :parameter output_directory_path: The path to the output directory where the files should be downloaded.
+        :parameter number_of_threads: The maximum number of concurrent downloads.
+        """
+
+        file_urls_and_names = list(file_urls_and_names)
+
+        number_of_threads = max(1, min(number_of_threads, len(file_urls_and_names)))
+
+        with ThreadPoolExecutor(
+            max_workers=number_of_threads
+        ) as thread_pool_executor:
+            futures = [
+                thread_pool_executor.submit(
+                    BaseDataSourceDownloadUtility.download_file,
+                    file_url=file_url,
+                    file_name=file_name,
+                    output_directory_path=output_directory_path,
+                    number_of_ranges=min(
+                        PARALLEL_DOWNLOAD_NUMBER_OF_RANGES,
+                        max(1, HTTP_CONNECTION_POOL_MAXIMUM_SIZE // number_of_threads)
+                    ),
+                    show_progress_bar=False
+                ) for file_url, file_name in file_urls_and_names
+            ]
+
+            for future in tqdm(
+                iterable=as_completed(futures),
+                desc="Downloading the files",
+                total=len(futures),
+                ncols=150,
+                disable=None
+            ):
+                future.result()
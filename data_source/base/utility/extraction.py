@@ -0,0 +1,194 @@
+""" The ``data_source.base.utility`` package ``extraction`` module. """
+
+from concurrent.futures import ThreadPoolExecutor
+from io import BufferedReader
+from os import PathLike, cpu_count
+from pathlib import Path
+from typing import BinaryIO, List, Union
+
+from zipfile import ZipFile
+
+try:
+    from isal.igzip import open as gzip_open
+
+    IS_ISAL_AVAILABLE = True
+
+except ImportError:
+    from gzip import open as gzip_open
+
+    IS_ISAL_AVAILABLE = False
+
+try:
+    from rapidgzip import open as parallel_gzip_open
+
+except ImportError:
+    parallel_gzip_open = None
+
+try:
+    from os import POSIX_FADV_SEQUENTIAL, posix_fadvise
+
+except ImportError:
+    POSIX_FADV_SEQUENTIAL, posix_fadvise = None, None
+
+
+EXTRACT_BUFFER_SIZE = 1 << 20
+
+GZIP_READ_BUFFER_SIZE = 1 << 17
+
+PARALLEL_GZIP_MINIMUM_FILE_SIZE = 1 << 28
+
+ZIP_EXTRACTION_NUMBER_OF_THREADS = min(8, cpu_count() or 1)
+
+
+class BaseDataSourceExtractionUtility:
+    """ The base data source extraction utility class. """
+
+    @staticmethod
+    def open_gzip_archive_file(
+            input_file: Union[str, PathLike[str], BinaryIO]
+    ) -> BufferedReader:
+        """
+        Open a gzip archive file for reading using the `isal` library, if available, or the `gzip` library otherwise.
+
+        The large gzip archive files are decompressed in parallel using the `rapidgzip` library, if available.
+
+        :parameter input_file: The path to or the handle of the gzip archive file.
+
+        :returns: The buffered handle of the decompressed gzip archive file.
+        """
+
+        if parallel_gzip_open is not None and isinstance(input_file, (str, PathLike)) and \
+                Path(input_file).stat().st_size >= PARALLEL_GZIP_MINIMUM_FILE_SIZE:
+            return BufferedReader(
+                raw=parallel_gzip_open(
+                    str(input_file),
+                    parallelization=cpu_count() or 1
+                ),
+                buffer_size=GZIP_READ_BUFFER_SIZE
+            )
+
+        return BufferedReader(
+            raw=gzip_open(
+                input_file,
+                mode="rb"
+            ),
+            buffer_size=GZIP_READ_BUFFER_SIZE
+        )
+
+    @staticmethod
+    def _advise_sequential_access(
+            file_handle: BinaryIO
+    ) -> None:
+        """
+        Advise the kernel that a file handle will be accessed sequentially, if the platform and the handle support it.
+
+        :parameter file_handle: The file handle.
+        """
+
+        if posix_fadvise is not None:
+            try:
+                posix_fadvise(file_handle.fileno(), 0, 0, POSIX_FADV_SEQUENTIAL)
+
+            except (AttributeError, OSError, ValueError):
+                pass
+
+    @staticmethod
+    def copy_file_handle(
+            source_file_handle: BinaryIO,
+            destination_file_handle: BinaryIO,
+            buffer_size: int = EXTRACT_BUFFER_SIZE
+    ) -> None:
+        """
+        Copy the content of a source file handle to a destination file handle.
+
+        The content is read into a single preallocated buffer, which is reused for the whole copy.
+
+        :parameter source_file_handle: The source file handle.
+        :parameter destination_file_handle: The destination file handle.
+        :parameter buffer_size: The size of the buffer.
+        """
+
+        for file_handle in [source_file_handle, destination_file_handle]:
+            BaseDataSourceExtractionUtility._advise_sequential_access(
+                file_handle=file_handle
+            )
+
+        buffer = bytearray(buffer_size)
+
+        buffer_view = memoryview(buffer)
+
+        while True:
+            number_of_bytes = source_file_handle.readinto(buffer)
+
+            if not number_of_bytes:
+                break
+
+            destination_file_handle.write(buffer_view[:number_of_bytes])
+
+    @staticmethod
+    def _extract_zip_archive_file_members(
+            input_file_path: Union[str, PathLike[str]],
+            member_names: List[str],
+            output_directory_path: Union[str, PathLike[str]]
+    ) -> None:
+        """
+        Extract some of the members of a zip archive file using a dedicated handle of the zip archive file.
+
+        :parameter input_file_path: The path to the zip archive file.
+        :parameter member_names: The names of the members of the zip archive file that should be extracted.
+        :parameter output_directory_path: The path to the output directory where the members should be extracted.
+        """
+
+        with ZipFile(
+            file=input_file_path
+        ) as zip_archive_file_handle:
+            for member_name in member_names:
+                try:
+                    zip_archive_file_handle.extract(
+                        member=member_name,
+                        path=output_directory_path
+                    )
+
+                # The parent directory of the member is created concurrently by another thread.
+                except FileExistsError:
+                    zip_archive_file_handle.extract(
+                        member=member_name,
+                        path=output_directory_path
+                    )
+
+    @staticmethod
+    def extract_zip_archive_file(
+            input_file_path: Union[str, PathLike[str]],
+            output_directory_path: Union[str, PathLike[str]],
+            number_of_threads: int = ZIP_EXTRACTION_NUMBER_OF_THREADS
+    ) -> None:
+        """
+        Extract all of the members of a zip archive file in parallel.
+
+        The members are distributed across the threads, each of which opens its own handle of the zip archive file,
+        since a single handle cannot be shared between the threads.
+
+        :parameter input_file_path: The path to the zip archive file.
+        :parameter output_directory_path: The path to the output directory where the members should be extracted.
+        :parameter number_of_threads: The number of threads.
+        """
+
+        with ZipFile(
+            file=input_file_path
+        ) as zip_archive_file_handle:
+            member_names = zip_archive_file_handle.namelist()
+
+        with ThreadPoolExecutor(
+            max_workers=number_of_threads
+        ) as thread_pool_executor:
+            futures = [
+                thread_pool_executor.submit(
+                    BaseDataSourceExtractionUtility._extract_zip_archive_file_members,
+                    input_file_path=input_file_path,
+                    member_names=member_names[thread_index::number_of_threads],
+                    output_directory_path=output_directory_path
+                ) for thread_index in range(number_of_threads)
+            ]
+
+            for future in futures:
+                future.result()
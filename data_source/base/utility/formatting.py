@@ -0,0 +1,118 @@
+""" The ``data_source.base.utility`` package ``formatting`` module. """
+
+from os import PathLike
+from typing import BinaryIO, Dict, Optional, Union
+
+from pyarrow import RecordBatch, Schema, field, repeat, scalar, string
+from pyarrow.csv import ConvertOptions, CSVWriter, ParseOptions, ReadOptions, WriteOptions, open_csv
+from pyarrow.parquet import ParquetWriter
+
+
+SUPPORTED_OUTPUT_FILE_FORMATS = (
+    "csv",
+    "parquet",
+)
+
+
+class BaseDataSourceFormattingUtility:
+    """ The base data source formatting utility class. """
+
+    @staticmethod
+    def open_output_file_writer(
+            output_file_path: Union[str, PathLike[str]],
+            output_schema: Schema,
+            output_file_format: str = "csv"
+    ) -> Union[CSVWriter, ParquetWriter]:
+        """
+        Open a writer of the record batches to a CSV or Parquet output file.
+
+        The Parquet output file is compressed using the `snappy` codec and dictionary encoding.
+
+        :parameter output_file_path: The path to the output file.
+        :parameter output_schema: The schema of the output file.
+        :parameter output_file_format: The format of the output file: { `csv`, `parquet` }.
+
+        :returns: The writer of the record batches to the output file.
+        """
+
+        if output_file_format == "parquet":
+            return ParquetWriter(
+                where=str(output_file_path),
+                schema=output_schema,
+                compression="snappy",
+                use_dictionary=True
+            )
+
+        return CSVWriter(
+            sink=str(output_file_path),
+            schema=output_schema,
+            write_options=WriteOptions(
+                quoting_header="none"
+            )
+        )
+
+    @staticmethod
+    def format_delimited_file(
+            input_file: Union[str, PathLike[str], BinaryIO],
+            output_file_path: Union[str, PathLike[str]],
+            constant_columns: Optional[Dict[str, str]] = None,
+            read_options: Optional[ReadOptions] = None,
+            parse_options: Optional[ParseOptions] = None,
+            convert_options: Optional[ConvertOptions] = None,
+            output_file_format: str = "csv"
+    ) -> None:
+        """
+        Format a delimited file into a CSV or Parquet file by streaming it batch by batch.
+
+        :parameter input_file: The path to or the handle of the delimited input file.
+        :parameter output_file_path: The path to the output file.
+        :parameter constant_columns: The names and values of the constant columns that should be appended.
+        :parameter read_options: The options for the adjustment of the reading of the input file.
+        :parameter parse_options: The options for the adjustment of the parsing of the input file.
+        :parameter convert_options: The options for the adjustment of the conversion of the input file.
+        :parameter output_file_format: The format of the output file: { `csv`, `parquet` }.
+        """
+
+        if output_file_format not in SUPPORTED_OUTPUT_FILE_FORMATS:
+            raise ValueError(
+                "The output file format '{output_file_format:s}' is not supported.".format(
+                    output_file_format=output_file_format
+                )
+            )
+
+        if constant_columns is None:
+            constant_columns = dict()
+
+        with open_csv(
+            input_file=input_file,
+            read_options=read_options,
+            parse_options=parse_options,
+            convert_options=convert_options
+        ) as csv_stream_reader:
+            output_schema = csv_stream_reader.schema
+
+            for column_name in constant_columns.keys():
+                output_schema = output_schema.append(
+                    field(column_name, string())
+                )
+
+            with BaseDataSourceFormattingUtility.open_output_file_writer(
+                output_file_path=output_file_path,
+                output_schema=output_schema,
+                output_file_format=output_file_format
+            ) as output_file_writer:
+                for record_batch in csv_stream_reader:
+                    output_file_writer.write_batch(
+                        batch=RecordBatch.from_arrays(
+                            arrays=record_batch.columns + [
+                                repeat(
+                                    value=scalar(
+                                        value=column_value,
+                                        type=string()
+                                    ),
+                                    size=record_batch.num_rows
+                                ) for column_value in constant_columns.values()
+                            ],
+                            schema=output_schema
+                        )
+                    )
@@ -1,8 +1,10 @@
 """ The ``data_source.compound.chembl`` package ``chembl`` module. """
 
+from functools import partial
+from logging import Logger
 from os import PathLike
-from re import search
-from typing import Dict, Union
+from re import compile as compile_pattern
+from typing import Dict, Optional, Union
 
 from data_source.base.base import BaseDataSource
 from data_source.base.utility.download import BaseDataSourceDownloadUtility
@@ -12,37 +14,60 @@ from data_source.compound.chembl.utility.extraction import ChEMBLCompoundDatabas
 from data_source.compound.chembl.utility.formatting import ChEMBLCompoundDatabaseFormattingUtility
 
 
+LATEST_RELEASE_NUMBER_PATTERN = compile_pattern(
+    pattern=rb"Release:\s*chembl_(\d+)"
+)
+
+V_RELEASE_VERSION_PATTERN = compile_pattern(
+    pattern=r"v_release_(\d+)"
+)
+
+
 class ChEMBLCompoundDatabase(BaseDataSource):
     """ The `ChEMBL <https://www.ebi.ac.uk/chembl>`_ chemical compound database class. """
 
-    def get_supported_versions(
+    def __init__(
+            self,
+            logger: Optional[Logger] = None
+    ) -> None:
+        """
+        The constructor method of the class.
+
+        :parameter logger: The logger. The value `None` indicates that the logger should not be utilized.
+        """
+
+        super().__init__(
+            logger=logger
+        )
+
+        self.__latest_release_number = None
+
+    def _get_latest_release_number(
             self
-    ) -> Dict[str, str]:
+    ) -> int:
         """
-        Get the supported versions of the database.
+        Get the latest release number of the database.
 
-        :returns: The supported versions of the database.
+        The latest release number is retrieved once per instance and reused afterwards.
+
+        :returns: The latest release number of the database.
         """
 
+        if self.__latest_release_number is not None:
+            return self.__latest_release_number
+
         try:
             http_get_request_response = BaseDataSourceDownloadUtility.send_http_get_request(
                 http_get_request_url="https://ftp.ebi.ac.uk/pub/databases/chembl/ChEMBLdb/latest/README"
             )
 
-            latest_release_number = int(
-                search(
-                    pattern=r"Release:\s*chembl_(\d+)",
-                    string=str(http_get_request_response.content)
+            self.__latest_release_number = int(
+                LATEST_RELEASE_NUMBER_PATTERN.search(
+                    http_get_request_response.content
                 ).group(1)
             )
 
-            return {
-                "v_release_{release_number:d}".format(
-                    release_number=release_number
-                ): "https://doi.org/10.6019/CHEMBL.database.{release_number:d}".format(
-                    release_number=release_number
-                ) for release_number in range(25, latest_release_number + 1)
-            }
+            return self.__latest_release_number
 
         except Exception as exception_handle:
             if self.logger is not None:
@@ -52,6 +77,41 @@ class ChEMBLCompoundDatabase(BaseDataSource):
 
             raise
 
+    def _is_supported_version(
+            self,
+            version: str
+    ) -> bool:
+        """
+        Check whether a version of the database is supported.
+
+        :parameter version: The version of the database.
+
+        :returns: The indicator of whether the version of the database is supported.
+        """
+
+        version_match = V_RELEASE_VERSION_PATTERN.fullmatch(
+            version
+        )
+
+        return version_match is not None and 25 <= int(version_match.group(1)) <= self._get_latest_release_number()
+
+    def get_supported_versions(
+            self
+    ) -> Dict[str, str]:
+        """
+        Get the supported versions of the database.
+
+        :returns: The supported versions of the database.
+        """
+
+        return {
+            "v_release_{release_number:d}".format(
+                release_number=release_number
+            ): "https://doi.org/10.6019/CHEMBL.database.{release_number:d}".format(
+                release_number=release_number
+            ) for release_number in range(25, self._get_latest_release_number() + 1)
+        }
+
     def download(
             self,
             version: str,
@@ -65,48 +125,21 @@ class ChEMBLCompoundDatabase(BaseDataSource):
         :parameter output_directory_path: The path to the output directory where the data should be downloaded.
         """
 
-        try:
-            if version in self.get_supported_versions().keys():
-                if self.logger is not None:
-                    self.logger.info(
-                        msg="The download of the data from the {data_source:s} has been started.".format(
-                            data_source="ChEMBL chemical compound database ({version:s})".format(
-                                version=version
-                            )
-                        )
-                    )
-
-                if version.startswith("v_release"):
-                    ChEMBLCompoundDatabaseDownloadUtility.download_v_release(
-                        version=version,
-                        output_directory_path=output_directory_path
-                    )
-
-                if self.logger is not None:
-                    self.logger.info(
-                        msg="The download of the data from the {data_source:s} has been completed.".format(
-                            data_source="ChEMBL chemical compound database ({version:s})".format(
-                                version=version
-                            )
-                        )
-                    )
-
-            else:
-                raise ValueError(
-                    "The download of the data from the {data_source:s} is not supported.".format(
-                        data_source="ChEMBL chemical compound database ({version:s})".format(
-                            version=version
-                        )
-                    )
-                )
-
-        except Exception as exception_handle:
-            if self.logger is not None:
-                self.logger.error(
-                    msg=exception_handle
-                )
-
-            raise
+        self._run_stage(
+            stage_name="download",
+            data_source_name="ChEMBL chemical compound database ({version:s})".format(
+                version=version
+            ),
+            is_supported=partial(
+                self._is_supported_version,
+                version=version
+            ),
+            stage_function=partial(
+                ChEMBLCompoundDatabaseDownloadUtility.download_v_release,
+                version=version,
+                output_directory_path=output_directory_path
+            )
+        )
 
     def extract(
             self,
@@ -123,49 +156,22 @@ class ChEMBLCompoundDatabase(BaseDataSource):
         :parameter output_directory_path: The path to the output directory where the data should be extracted.
         """
 
-        try:
-            if version in self.get_supported_versions().keys():
-                if self.logger is not None:
-                    self.logger.info(
-                        msg="The extraction of the data from the {data_source:s} has been started.".format(
-                            data_source="ChEMBL chemical compound database ({version:s})".format(
-                                version=version
-                            )
-                        )
-                    )
-
-                if version.startswith("v_release"):
-                    ChEMBLCompoundDatabaseExtractionUtility.extract_v_release(
-                        version=version,
-                        input_directory_path=input_directory_path,
-                        output_directory_path=output_directory_path
-                    )
-
-                if self.logger is not None:
-                    self.logger.info(
-                        msg="The extraction of the data from the {data_source:s} has been completed.".format(
-                            data_source="ChEMBL chemical compound database ({version:s})".format(
-                                version=version
-                            )
-                        )
-                    )
-
-            else:
-                raise ValueError(
-                    "The extraction of the data from the {data_source:s} is not supported.".format(
-                        data_source="ChEMBL chemical compound database ({version:s})".format(
-                            version=version
-                        )
-                    )
-                )
-
-        except Exception as exception_handle:
-            if self.logger is not None:
-                self.logger.error(
-                    msg=exception_handle
-                )
-
-            raise
+        self._run_stage(
+            stage_name="extraction",
+            data_source_name="ChEMBL chemical compound database ({version:s})".format(
+                version=version
+            ),
+            is_supported=partial(
+                self._is_supported_version,
+                version=version
+            ),
+            stage_function=partial(
+                ChEMBLCompoundDatabaseExtractionUtility.extract_v_release,
+                version=version,
+                input_directory_path=input_directory_path,
+                output_directory_path=output_directory_path
+            )
+        )
 
     def format(
             self,
@@ -177,51 +183,88 @@ class ChEMBLCompoundDatabase(BaseDataSource):
         """
         Format the data from the database.
 
+        The downloaded data is formatted directly, so the extraction of the data can be skipped.
+
         :parameter version: The version of the database.
-        :parameter input_directory_path: The path to the input directory where the data is extracted.
+        :parameter input_directory_path: The path to the input directory where the data is downloaded or extracted.
         :parameter output_directory_path: The path to the output directory where the data should be formatted.
         """
 
-        try:
-            if version in self.get_supported_versions().keys():
-                if self.logger is not None:
-                    self.logger.info(
-                        msg="The formatting of the data from the {data_source:s} has been started.".format(
-                            data_source="ChEMBL chemical compound database ({version:s})".format(
-                                version=version
-                            )
-                        )
-                    )
-
-                if version.startswith("v_release"):
-                    ChEMBLCompoundDatabaseFormattingUtility.format_v_release(
-                        version=version,
-                        input_directory_path=input_directory_path,
-                        output_directory_path=output_directory_path
-                    )
-
-                if self.logger is not None:
-                    self.logger.info(
-                        msg="The formatting of the data from the {data_source:s} has been completed.".format(
-                            data_source="ChEMBL chemical compound database ({version:s})".format(
-                                version=version
-                            )
-                        )
-                    )
-
-            else:
-                raise ValueError(
-                    "The formatting of the data from the {data_source:s} is not supported.".format(
-                        data_source="ChEMBL chemical compound database ({version:s})".format(
-                            version=version
-                        )
-                    )
-                )
+        self._run_stage(
+            stage_name="formatting",
+            data_source_name="ChEMBL chemical compound database ({version:s})".format(
+                version=version
+            ),
+            is_supported=partial(
+                self._is_supported_version,
+                version=version
+            ),
+            stage_function=partial(
+                ChEMBLCompoundDatabaseFormattingUtility.format_v_release,
+                version=version,
+                input_directory_path=input_directory_path,
+                output_directory_path=output_directory_path
+            )
+        )
 
-        except Exception as exception_handle:
-            if self.logger is not None:
-                self.logger.error(
-                    msg=exception_handle
+    def run_pipeline(
+            self,
+            version: str,
+            output_directory_path: Union[str, PathLike[str]],
+            resume_directory_path: Optional[Union[str, PathLike[str]]] = None,
+            **kwargs
+    ) -> None:
+        """
+        Download, extract, and format the data from the database.
+
+        The downloaded data is streamed directly into the formatting, without writing any intermediate files.
+
+        :parameter version: The version of the database.
+        :parameter output_directory_path: The path to the output directory where the data should be formatted.
+        :parameter resume_directory_path: The path to the directory where the data should be downloaded and extracted.
+            It is ignored, since no intermediate files are written.
+        """
+
+        if resume_directory_path is not None and self.logger is not None:
+            self.logger.warning(
+                msg="The data is streamed, so the '{directory_path:s}' directory is not utilized.".format(
+                    directory_path=str(resume_directory_path)
                 )
+            )
 
-            raise
+        self._run_stage(
+            stage_name="streamed formatting",
+            data_source_name="ChEMBL chemical compound database ({version:s})".format(
+                version=version
+            ),
+            is_supported=partial(
+                self._is_supported_version,
+                version=version
+            ),
+            stage_function=partial(
+                self._stream_v_release,
+                version=version,
+                output_directory_path=output_directory_path
+            )
+        )
+
+    @staticmethod
+    def _stream_v_release(
+            version: str,
+            output_directory_path: Union[str, PathLike[str]]
+    ) -> None:
+        """
+        Stream the data from a `v_release_*` version of the database directly into the formatting.
+
+        :parameter version: The version of the database.
+        :parameter output_directory_path: The path to the output directory where the data should be formatted.
+        """
+
+        with ChEMBLCompoundDatabaseDownloadUtility.open_v_release_stream(
+            version=version
+        ) as file_stream_handle:
+            ChEMBLCompoundDatabaseFormattingUtility.format_v_release_stream(
+                version=version,
+                input_file_handle=file_stream_handle,
+                output_directory_path=output_directory_path
+            )
@@ -1,7 +1,8 @@
 """ The ``data_source.compound.chembl.utility`` package ``download`` module. """
 
+from contextlib import contextmanager
 from os import PathLike
-from typing import Union
+from typing import BinaryIO, Iterator, Tuple, Union
 
 from data_source.base.utility.download import BaseDataSourceDownloadUtility
 
@@ -10,19 +11,20 @@ class ChEMBLCompoundDatabaseDownloadUtility:
     """ The `ChEMBL <https://www.ebi.ac.uk/chembl>`_ chemical compound database download utility class. """
 
     @staticmethod
-    def download_v_release(
-            version: str,
-            output_directory_path: Union[str, PathLike[str]]
-    ) -> None:
+    def _get_v_release_file_url_and_name(
+            version: str
+    ) -> Tuple[str, str]:
         """
-        Download the data from a `v_release_*` version of the database.
+        Get the URL and name of the file from a `v_release_*` version of the database.
 
         :parameter version: The version of the database.
-        :parameter output_directory_path: The path to the output directory where the data should be downloaded.
+
+        :returns: The URL and name of the file.
         """
 
-        release_number = version.split(
-            sep="_"
+        release_number = version.rsplit(
+            sep="_",
+            maxsplit=1
         )[-1]
 
         file_name = "chembl_{release_number:s}_chemreps.txt.gz".format(
@@ -34,8 +36,49 @@ class ChEMBLCompoundDatabaseDownloadUtility:
             file_name=file_name
         )
 
+        return file_url, file_name
+
+    @staticmethod
+    def download_v_release(
+            version: str,
+            output_directory_path: Union[str, PathLike[str]]
+    ) -> None:
+        """
+        Download the data from a `v_release_*` version of the database.
+
+        :parameter version: The version of the database.
+        :parameter output_directory_path: The path to the output directory where the data should be downloaded.
+        """
+
+        file_url, file_name = ChEMBLCompoundDatabaseDownloadUtility._get_v_release_file_url_and_name(
+            version=version
+        )
+
         BaseDataSourceDownloadUtility.download_file(
             file_url=file_url,
             file_name=file_name,
             output_directory_path=output_directory_path
         )
+
+    @staticmethod
+    @contextmanager
+    def open_v_release_stream(
+            version: str
+    ) -> Iterator[BinaryIO]:
+        """
+        Open a stream of the data from a `v_release_*` version of the database without downloading it.
+
+        :parameter version: The version of the database.
+
+        :returns: The handle of the compressed data stream.
+        """
+
+        file_url, file_name = ChEMBLCompoundDatabaseDownloadUtility._get_v_release_file_url_and_name(
+            version=version
+        )
+
+        with BaseDataSourceDownloadUtility.open_file_stream(
+            file_url=file_url,
+            file_name=file_name
+        ) as file_stream_handle:
+            yield file_stream_handle
@@ -2,11 +2,9 @@
 
 from os import PathLike
 from pathlib import Path
-from shutil import copyfileobj
+from shutil import copyfile
 from typing import Union
 
-from gzip import GzipFile
-
 
 class ChEMBLCompoundDatabaseExtractionUtility:
     """ The `ChEMBL <https://www.ebi.ac.uk/chembl>`_ chemical compound database extraction utility class. """
@@ -20,30 +18,29 @@ class ChEMBLCompoundDatabaseExtractionUtility:
         """
         Extract the data from a `v_release_*` version of the database.
 
+        The archive file is formatted directly, so this step can be skipped. For backward compatibility, the archive
+        file is copied to the output directory if the directories differ.
+
         :parameter version: The version of the database.
         :parameter input_directory_path: The path to the input directory where the data is downloaded.
         :parameter output_directory_path: The path to the output directory where the data should be extracted.
         """
 
-        release_number = version.split(
-            sep="_"
+        release_number = version.rsplit(
+            sep="_",
+            maxsplit=1
         )[-1]
 
         input_file_name = "chembl_{release_number:s}_chemreps.txt.gz".format(
             release_number=release_number
         )
 
-        output_file_name = input_file_name[:-3]
-
-        with GzipFile(
-            filename=Path(input_directory_path, input_file_name)
-        ) as gzip_archive_file_handle:
-            with open(
-                file=Path(output_directory_path, output_file_name),
-                mode="wb"
-            ) as destination_file_handle:
-                # noinspection PyTypeChecker
-                copyfileobj(
-                    fsrc=gzip_archive_file_handle,
-                    fdst=destination_file_handle
-                )
+        input_file_path = Path(input_directory_path, input_file_name)
+
+        output_file_path = Path(output_directory_path, input_file_name)
+
+        if input_file_path.resolve() != output_file_path.resolve():
+            copyfile(
+                src=input_file_path,
+                dst=output_file_path
+            )
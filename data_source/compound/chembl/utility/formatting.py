@@ -3,36 +3,37 @@
 from datetime import datetime
 from os import PathLike
 from pathlib import Path
-from typing import Union
+from typing import BinaryIO, Union
 
-from pandas.io.parsers.readers import read_csv
+from pyarrow import string
+from pyarrow.csv import ConvertOptions, ParseOptions
+
+from data_source.base.utility.extraction import BaseDataSourceExtractionUtility
+from data_source.base.utility.formatting import BaseDataSourceFormattingUtility
 
 
 class ChEMBLCompoundDatabaseFormattingUtility:
     """ The `ChEMBL <https://www.ebi.ac.uk/chembl>`_ chemical compound database formatting utility class. """
 
     @staticmethod
-    def format_v_release(
+    def _format_v_release_archive_file(
             version: str,
-            input_directory_path: Union[str, PathLike[str]],
+            input_file: Union[str, PathLike[str], BinaryIO],
             output_directory_path: Union[str, PathLike[str]]
     ) -> None:
         """
-        Format the data from a `v_release_*` version of the database.
+        Format the data from a `v_release_*` version of the database archive file.
 
         :parameter version: The version of the database.
-        :parameter input_directory_path: The path to the input directory where the data is extracted.
+        :parameter input_file: The path to or the handle of the compressed input file.
         :parameter output_directory_path: The path to the output directory where the data should be formatted.
         """
 
-        release_number = version.split(
-            sep="_"
+        release_number = version.rsplit(
+            sep="_",
+            maxsplit=1
         )[-1]
 
-        input_file_name = "chembl_{release_number:s}_chemreps.txt".format(
-            release_number=release_number
-        )
-
         output_file_name = "{timestamp:s}_chembl_{version:s}.csv".format(
             timestamp=datetime.now().strftime(
                 format="%Y%m%d%H%M%S"
@@ -40,15 +41,83 @@ class ChEMBLCompoundDatabaseFormattingUtility:
             version=version
         )
 
-        dataframe = read_csv(
-            filepath_or_buffer=Path(input_directory_path, input_file_name),
-            sep="\t",
-            header=0
+        with BaseDataSourceExtractionUtility.open_gzip_archive_file(
+            input_file=input_file
+        ) as gzip_archive_file_handle:
+            BaseDataSourceFormattingUtility.format_delimited_file(
+                input_file=gzip_archive_file_handle,
+                output_file_path=Path(output_directory_path, output_file_name),
+                constant_columns={
+                    "file_name": "chembl_{release_number:s}_chemreps.txt".format(
+                        release_number=release_number
+                    ),
+                },
+                parse_options=ParseOptions(
+                    delimiter="\t",
+                    quote_char=False
+                ),
+                convert_options=ConvertOptions(
+                    column_types={
+                        column_name: string()
+                        for column_name in [
+                            "chembl_id",
+                            "canonical_smiles",
+                            "standard_inchi",
+                            "standard_inchi_key",
+                        ]
+                    }
+                )
+            )
+
+    @staticmethod
+    def format_v_release(
+            version: str,
+            input_directory_path: Union[str, PathLike[str]],
+            output_directory_path: Union[str, PathLike[str]]
+    ) -> None:
+        """
+        Format the data from a `v_release_*` version of the database.
+
+        The `chembl_*_chemreps.txt.gz` archive file is decompressed on the fly, so the input directory can be the one
+        where the data is downloaded.
+
+        :parameter version: The version of the database.
+        :parameter input_directory_path: The path to the input directory where the data is downloaded or extracted.
+        :parameter output_directory_path: The path to the output directory where the data should be formatted.
+        """
+
+        release_number = version.rsplit(
+            sep="_",
+            maxsplit=1
+        )[-1]
+
+        ChEMBLCompoundDatabaseFormattingUtility._format_v_release_archive_file(
+            version=version,
+            input_file=Path(
+                input_directory_path,
+                "chembl_{release_number:s}_chemreps.txt.gz".format(
+                    release_number=release_number
+                )
+            ),
+            output_directory_path=output_directory_path
         )
 
-        dataframe["file_name"] = input_file_name
+    @staticmethod
+    def format_v_release_stream(
+            version: str,
+            input_file_handle: BinaryIO,
+            output_directory_path: Union[str, PathLike[str]]
+    ) -> None:
+        """
+        Format the data from a `v_release_*` version of the database stream.
+
+        :parameter version: The version of the database.
+        :parameter input_file_handle: The handle of the compressed data stream.
+        :parameter output_directory_path: The path to the output directory where the data should be formatted.
+        """
 
-        dataframe.to_csv(
-            path_or_buf=Path(output_directory_path, output_file_name),
-            index=False
+        ChEMBLCompoundDatabaseFormattingUtility._format_v_release_archive_file(
+            version=version,
+            input_file=input_file_handle,
+            output_directory_path=output_directory_path
         )
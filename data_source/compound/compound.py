@@ -1,16 +1,25 @@
 """ The ``data_source.compound`` package ``compound`` module. """
 
+from concurrent.futures import ThreadPoolExecutor
 from logging import Logger
 from os import PathLike
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 from data_source.base.base import BaseDataSource
+from data_source.names import SUPPORTED_DATA_SOURCE_NAMES
 
 from data_source.compound.chembl.chembl import ChEMBLCompoundDatabase
 from data_source.compound.miscellaneous.miscellaneous import MiscellaneousCompoundDataSource
 from data_source.compound.zinc.zinc import ZINCCompoundDatabase
 
 
+SUPPORTED_DATA_SOURCE_CLASSES = {
+    "chembl": ChEMBLCompoundDatabase,
+    "miscellaneous": MiscellaneousCompoundDataSource,
+    "zinc": ZINCCompoundDatabase,
+}
+
+
 class CompoundDataSource(BaseDataSource):
     """ The chemical compound data source class. """
 
@@ -29,27 +38,22 @@ class CompoundDataSource(BaseDataSource):
         )
 
         self.supported_data_sources = {
-            "chembl": ChEMBLCompoundDatabase(
-                logger=logger
-            ),
-            "miscellaneous": MiscellaneousCompoundDataSource(
+            name: data_source_class(
                 logger=logger
-            ),
-            "zinc": ZINCCompoundDatabase(
-                logger=logger
-            ),
+            ) for name, data_source_class in SUPPORTED_DATA_SOURCE_CLASSES.items()
         }
 
-    def get_names_of_supported_data_sources(
-            self
-    ) -> List[str]:
+    @staticmethod
+    def get_names_of_supported_data_sources() -> List[str]:
         """
         Get the names of the supported data sources.
 
+        The names are available without constructing or even importing any of the data sources.
+
         :returns: The names of the supported data sources.
         """
 
-        return list(self.supported_data_sources.keys())
+        return list(SUPPORTED_DATA_SOURCE_NAMES["compound"])
 
     def get_supported_versions(
             self,
@@ -115,6 +119,34 @@ class CompoundDataSource(BaseDataSource):
 
             raise exception_handle
 
+    def download_many(
+            self,
+            jobs: List[Tuple[str, str, Union[str, PathLike[str]]]],
+            max_workers: int = 8
+    ) -> None:
+        """
+        Download the data from multiple data sources concurrently.
+
+        :parameter jobs: The names of the data sources, versions of the data sources, and paths to the output
+            directories where the data should be downloaded.
+        :parameter max_workers: The maximum number of concurrent downloads.
+        """
+
+        with ThreadPoolExecutor(
+            max_workers=max_workers
+        ) as thread_pool_executor:
+            futures = [
+                thread_pool_executor.submit(
+                    self.download,
+                    name=name,
+                    version=version,
+                    output_directory_path=output_directory_path
+                ) for name, version, output_directory_path in jobs
+            ]
+
+            for future in futures:
+                future.result()
+
     def extract(
             self,
             name: str,
@@ -174,7 +206,44 @@ class CompoundDataSource(BaseDataSource):
             self.supported_data_sources[name].format(
                 version=version,
                 input_directory_path=input_directory_path,
-                output_directory_path=output_directory_path
+                output_directory_path=output_directory_path,
+                **kwargs
+            )
+
+        else:
+            exception_handle = ValueError(
+                "The chemical compound data source name '{name:s}' is not supported.".format(
+                    name=name
+                )
+            )
+
+            if self.logger is not None:
+                self.logger.error(
+                    msg=exception_handle
+                )
+
+            raise exception_handle
+
+    def run_pipeline(
+            self,
+            name: str,
+            version: str,
+            output_directory_path: Union[str, PathLike[str]],
+            **kwargs
+    ) -> None:
+        """
+        Download, extract, and format the data from a data source.
+
+        :parameter name: The name of the data source.
+        :parameter version: The version of the data source.
+        :parameter output_directory_path: The path to the output directory where the data should be formatted.
+        """
+
+        if name in self.get_names_of_supported_data_sources():
+            self.supported_data_sources[name].run_pipeline(
+                version=version,
+                output_directory_path=output_directory_path,
+                **kwargs
             )
 
         else:
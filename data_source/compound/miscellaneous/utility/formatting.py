@@ -5,7 +5,10 @@ from os import PathLike
 from pathlib import Path
 from typing import Union
 
-from pandas.io.parsers.readers import read_csv
+from pyarrow import string
+from pyarrow.csv import ConvertOptions
+
+from data_source.base.utility.formatting import BaseDataSourceFormattingUtility
 
 
 class MiscellaneousCompoundDataSourceFormattingUtility:
@@ -19,6 +22,9 @@ class MiscellaneousCompoundDataSourceFormattingUtility:
         """
         Format the data from the `v_moses_by_20201218_polykovskiy_d_et_al` version of the data source.
 
+        The known columns are read as strings, since the column types are otherwise inferred from the first batch only,
+        and a later value that does not fit them would stop the formatting partway through the output file.
+
         :parameter input_directory_path: The path to the input directory where the data is extracted.
         :parameter output_directory_path: The path to the output directory where the data should be formatted.
         """
@@ -31,14 +37,19 @@ class MiscellaneousCompoundDataSourceFormattingUtility:
             )
         )
 
-        dataframe = read_csv(
-            filepath_or_buffer=Path(input_directory_path, input_file_name),
-            header=0
-        )
-
-        dataframe["FILE_NAME"] = input_file_name
-
-        dataframe.to_csv(
-            path_or_buf=Path(output_directory_path, output_file_name),
-            index=False
+        BaseDataSourceFormattingUtility.format_delimited_file(
+            input_file=Path(input_directory_path, input_file_name),
+            output_file_path=Path(output_directory_path, output_file_name),
+            constant_columns={
+                "FILE_NAME": input_file_name,
+            },
+            convert_options=ConvertOptions(
+                column_types={
+                    column_name: string()
+                    for column_name in [
+                        "SMILES",
+                        "SPLIT",
+                    ]
+                }
+            )
         )
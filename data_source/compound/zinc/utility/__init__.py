@@ -5,3 +5,5 @@ from data_source.compound.zinc.utility.download import ZINCCompoundDatabaseDownl
 from data_source.compound.zinc.utility.extraction import ZINCCompoundDatabaseExtractionUtility
 
 from data_source.compound.zinc.utility.formatting import ZINCCompoundDatabaseFormattingUtility
+
+from data_source.compound.zinc.utility.version import ZINCCompoundDatabaseVersionUtility
@@ -1,9 +1,14 @@
 """ The ``data_source.compound.zinc.utility`` package ``download`` module. """
 
 from os import PathLike
+from pathlib import Path
 from typing import Union
 
 from data_source.base.utility.download import BaseDataSourceDownloadUtility
+from data_source.base.utility.extraction import BaseDataSourceExtractionUtility
+
+from data_source.compound.zinc.utility.extraction import BUILDING_BLOCKS_EXTRACT_BUFFER_SIZE
+from data_source.compound.zinc.utility.version import ZINCCompoundDatabaseVersionUtility
 
 
 class ZINCCompoundDatabaseDownloadUtility:
@@ -21,15 +26,8 @@ class ZINCCompoundDatabaseDownloadUtility:
         :parameter output_directory_path: The path to the output directory where the data should be downloaded.
         """
 
-        file_name = "{file_name_prefix:s}.smi.gz".format(
-            file_name_prefix=version.split(
-                sep="_",
-                maxsplit=3
-            )[-1]
-        )
-
-        file_url = "https://files.docking.org/bb/current/{file_name:s}".format(
-            file_name=file_name
+        file_url, file_name = ZINCCompoundDatabaseVersionUtility.get_file_url_and_name(
+            version=version
         )
 
         BaseDataSourceDownloadUtility.download_file(
@@ -39,26 +37,70 @@ class ZINCCompoundDatabaseDownloadUtility:
         )
 
     @staticmethod
-    def download_v_catalog(
+    def download_and_extract_v_building_blocks(
             version: str,
             output_directory_path: Union[str, PathLike[str]]
     ) -> None:
         """
-        Download the data from a `v_catalog_*` version of the database.
+        Download and extract the data from a `v_building_blocks_*` version of the database.
+
+        The downloaded data is decompressed on the fly, so the `*.smi.gz` archive file is never written. The stream is
+        read ahead in a background thread, so that the transfer overlaps with the decompression. The data is
+        decompressed into a partial file, which replaces the output file only once it is complete.
 
         :parameter version: The version of the database.
-        :parameter output_directory_path: The path to the output directory where the data should be downloaded.
+        :parameter output_directory_path: The path to the output directory where the data should be extracted.
         """
 
-        file_name = "{file_name_prefix:s}.src.txt".format(
-            file_name_prefix=version.split(
-                sep="_",
-                maxsplit=2
-            )[-1]
+        file_url, file_name = ZINCCompoundDatabaseVersionUtility.get_file_url_and_name(
+            version=version
+        )
+
+        partial_output_file_path = Path(
+            output_directory_path,
+            "{output_file_name:s}.part".format(
+                output_file_name=file_name[:-3]
+            )
         )
 
-        file_url = "https://files.docking.org/catalogs/source/{file_name:s}".format(
+        with BaseDataSourceDownloadUtility.open_file_stream(
+            file_url=file_url,
             file_name=file_name
+        ) as file_stream_handle:
+            with BaseDataSourceDownloadUtility.prefetch_file_stream(
+                file_handle=file_stream_handle
+            ) as prefetched_file_stream_handle:
+                with BaseDataSourceExtractionUtility.open_gzip_archive_file(
+                    input_file=prefetched_file_stream_handle
+                ) as gzip_archive_file_handle:
+                    with open(
+                        file=partial_output_file_path,
+                        mode="wb"
+                    ) as destination_file_handle:
+                        BaseDataSourceExtractionUtility.copy_file_handle(
+                            source_file_handle=gzip_archive_file_handle,
+                            destination_file_handle=destination_file_handle,
+                            buffer_size=BUILDING_BLOCKS_EXTRACT_BUFFER_SIZE
+                        )
+
+        partial_output_file_path.replace(
+            target=Path(output_directory_path, file_name[:-3])
+        )
+
+    @staticmethod
+    def download_v_catalog(
+            version: str,
+            output_directory_path: Union[str, PathLike[str]]
+    ) -> None:
+        """
+        Download the data from a `v_catalog_*` version of the database.
+
+        :parameter version: The version of the database.
+        :parameter output_directory_path: The path to the output directory where the data should be downloaded.
+        """
+
+        file_url, file_name = ZINCCompoundDatabaseVersionUtility.get_file_url_and_name(
+            version=version
         )
 
         BaseDataSourceDownloadUtility.download_file(
@@ -2,10 +2,14 @@
 
 from os import PathLike
 from pathlib import Path
-from shutil import copyfileobj
 from typing import Union
 
-from gzip import GzipFile
+from data_source.base.utility.extraction import BaseDataSourceExtractionUtility
+
+from data_source.compound.zinc.utility.version import ZINCCompoundDatabaseVersionUtility
+
+
+BUILDING_BLOCKS_EXTRACT_BUFFER_SIZE = 1 << 23
 
 
 class ZINCCompoundDatabaseExtractionUtility:
@@ -25,24 +29,21 @@ class ZINCCompoundDatabaseExtractionUtility:
         :parameter output_directory_path: The path to the output directory where the data should be extracted.
         """
 
-        input_file_name = "{input_file_name_prefix:s}.smi.gz".format(
-            input_file_name_prefix=version.split(
-                sep="_",
-                maxsplit=3
-            )[-1]
+        _, input_file_name = ZINCCompoundDatabaseVersionUtility.get_file_url_and_name(
+            version=version
         )
 
         output_file_name = input_file_name[:-3]
 
-        with GzipFile(
-            filename=Path(input_directory_path, input_file_name)
+        with BaseDataSourceExtractionUtility.open_gzip_archive_file(
+            input_file=Path(input_directory_path, input_file_name)
         ) as gzip_archive_file_handle:
             with open(
                 file=Path(output_directory_path, output_file_name),
                 mode="wb"
             ) as destination_file_handle:
-                # noinspection PyTypeChecker
-                copyfileobj(
-                    fsrc=gzip_archive_file_handle,
-                    fdst=destination_file_handle
+                BaseDataSourceExtractionUtility.copy_file_handle(
+                    source_file_handle=gzip_archive_file_handle,
+                    destination_file_handle=destination_file_handle,
+                    buffer_size=BUILDING_BLOCKS_EXTRACT_BUFFER_SIZE
                 )
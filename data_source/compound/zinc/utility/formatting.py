@@ -7,15 +7,119 @@ from typing import Union
 
 from pandas.io.parsers.readers import read_csv
 
+from pyarrow import ArrowInvalid, RecordBatch, string
+from pyarrow.csv import ConvertOptions, ParseOptions, ReadOptions
+
+from data_source.base.utility.formatting import BaseDataSourceFormattingUtility
+
+from data_source.compound.zinc.utility.version import ZINCCompoundDatabaseVersionUtility
+
+
+FORMATTING_BLOCK_SIZE = 1 << 24
+
+FORMATTING_CHUNK_SIZE = 1_000_000
+
 
 class ZINCCompoundDatabaseFormattingUtility:
     """ The `ZINC <https://zinc20.docking.org>`_ chemical compound database formatting utility class. """
 
+    @staticmethod
+    def _format_smiles_file(
+            input_file_path: Path,
+            output_file_path: Path,
+            output_file_format: str = "csv"
+    ) -> None:
+        """
+        Format a space-delimited file of the database containing the SMILES strings and identifiers of the compounds.
+
+        The file is streamed using the `pyarrow` library. If it is not strictly delimited by single spaces, it is
+        formatted chunk by chunk using the `pandas` library instead.
+
+        :parameter input_file_path: The path to the input file.
+        :parameter output_file_path: The path to the output file.
+        :parameter output_file_format: The format of the output file: { `csv`, `parquet` }.
+        """
+
+        try:
+            BaseDataSourceFormattingUtility.format_delimited_file(
+                input_file=input_file_path,
+                output_file_path=output_file_path,
+                constant_columns={
+                    "file_name": input_file_path.name,
+                },
+                read_options=ReadOptions(
+                    block_size=FORMATTING_BLOCK_SIZE,
+                    column_names=[
+                        "smiles",
+                        "id",
+                    ]
+                ),
+                parse_options=ParseOptions(
+                    delimiter=" ",
+                    quote_char=False
+                ),
+                convert_options=ConvertOptions(
+                    column_types={
+                        "smiles": string(),
+                        "id": string(),
+                    }
+                ),
+                output_file_format=output_file_format
+            )
+
+        except ArrowInvalid:
+            output_file_writer = None
+
+            for dataframe_chunk_index, dataframe_chunk in enumerate(read_csv(
+                filepath_or_buffer=input_file_path,
+                sep=r"\s+",
+                header=None,
+                dtype=str,
+                chunksize=FORMATTING_CHUNK_SIZE
+            )):
+                dataframe_chunk = dataframe_chunk.rename(
+                    columns={
+                        0: "smiles",
+                        1: "id",
+                    }
+                )
+
+                dataframe_chunk["file_name"] = input_file_path.name
+
+                if output_file_format == "parquet":
+                    record_batch = RecordBatch.from_pandas(
+                        df=dataframe_chunk,
+                        preserve_index=False
+                    )
+
+                    if output_file_writer is None:
+                        output_file_writer = BaseDataSourceFormattingUtility.open_output_file_writer(
+                            output_file_path=output_file_path,
+                            output_schema=record_batch.schema,
+                            output_file_format=output_file_format
+                        )
+
+                    output_file_writer.write_batch(
+                        batch=record_batch
+                    )
+
+                else:
+                    dataframe_chunk.to_csv(
+                        path_or_buf=output_file_path,
+                        mode="w" if dataframe_chunk_index == 0 else "a",
+                        header=dataframe_chunk_index == 0,
+                        index=False
+                    )
+
+            if output_file_writer is not None:
+                output_file_writer.close()
+
     @staticmethod
     def format_v_building_blocks(
             version: str,
             input_directory_path: Union[str, PathLike[str]],
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            output_file_format: str = "csv"
     ) -> None:
         """
         Format the data from a `v_building_blocks_*` version of the database.
@@ -23,45 +127,35 @@ class ZINCCompoundDatabaseFormattingUtility:
         :parameter version: The version of the database.
         :parameter input_directory_path: The path to the input directory where the data is extracted.
         :parameter output_directory_path: The path to the output directory where the data should be formatted.
+        :parameter output_file_format: The format of the output file: { `csv`, `parquet` }.
         """
 
-        input_file_name = "{input_file_name_prefix:s}.smi".format(
-            input_file_name_prefix=version.split(
-                sep="_",
-                maxsplit=3
-            )[-1]
+        _, input_file_name = ZINCCompoundDatabaseVersionUtility.get_file_url_and_name(
+            version=version
         )
 
-        output_file_name = "{timestamp:s}_zinc_{version:s}.csv".format(
+        input_file_name = input_file_name[:-3]
+
+        output_file_name = "{timestamp:s}_zinc_{version:s}.{output_file_format:s}".format(
             timestamp=datetime.now().strftime(
                 format="%Y%m%d%H%M%S"
             ),
-            version=version
-        )
-
-        dataframe = read_csv(
-            filepath_or_buffer=Path(input_directory_path, input_file_name),
-            sep=r"\s+",
-            header=None
-        ).rename(
-            columns={
-                0: "smiles",
-                1: "id",
-            }
+            version=version,
+            output_file_format=output_file_format
         )
 
-        dataframe["file_name"] = input_file_name
-
-        dataframe.to_csv(
-            path_or_buf=Path(output_directory_path, output_file_name),
-            index=False
+        ZINCCompoundDatabaseFormattingUtility._format_smiles_file(
+            input_file_path=Path(input_directory_path, input_file_name),
+            output_file_path=Path(output_directory_path, output_file_name),
+            output_file_format=output_file_format
         )
 
     @staticmethod
     def format_v_catalog(
             version: str,
             input_directory_path: Union[str, PathLike[str]],
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            output_file_format: str = "csv"
     ) -> None:
         """
         Format the data from a `v_catalog_*` version of the database.
@@ -69,36 +163,23 @@ class ZINCCompoundDatabaseFormattingUtility:
         :parameter version: The version of the database.
         :parameter input_directory_path: The path to the input directory where the data is extracted.
         :parameter output_directory_path: The path to the output directory where the data should be formatted.
+        :parameter output_file_format: The format of the output file: { `csv`, `parquet` }.
         """
 
-        input_file_name = "{input_file_name_prefix:s}.src.txt".format(
-            input_file_name_prefix=version.split(
-                sep="_",
-                maxsplit=2
-            )[-1]
+        _, input_file_name = ZINCCompoundDatabaseVersionUtility.get_file_url_and_name(
+            version=version
         )
 
-        output_file_name = "{timestamp:s}_zinc_{version:s}.csv".format(
+        output_file_name = "{timestamp:s}_zinc_{version:s}.{output_file_format:s}".format(
             timestamp=datetime.now().strftime(
                 format="%Y%m%d%H%M%S"
             ),
-            version=version.replace("-", "_")
+            version=version.replace("-", "_"),
+            output_file_format=output_file_format
         )
 
-        dataframe = read_csv(
-            filepath_or_buffer=Path(input_directory_path, input_file_name),
-            sep=r"\s+",
-            header=None
-        ).rename(
-            columns={
-                0: "smiles",
-                1: "id",
-            }
-        )
-
-        dataframe["file_name"] = input_file_name
-
-        dataframe.to_csv(
-            path_or_buf=Path(output_directory_path, output_file_name),
-            index=False
+        ZINCCompoundDatabaseFormattingUtility._format_smiles_file(
+            input_file_path=Path(input_directory_path, input_file_name),
+            output_file_path=Path(output_directory_path, output_file_name),
+            output_file_format=output_file_format
         )
@@ -0,0 +1,52 @@
+""" The ``data_source.compound.zinc.utility`` package ``version`` module. """
+
+from functools import lru_cache
+from typing import Tuple
+
+
+class ZINCCompoundDatabaseVersionUtility:
+    """ The `ZINC <https://zinc20.docking.org>`_ chemical compound database version utility class. """
+
+    @staticmethod
+    @lru_cache(
+        maxsize=256
+    )
+    def get_file_url_and_name(
+            version: str
+    ) -> Tuple[str, str]:
+        """
+        Get the URL and name of the file from a version of the database.
+
+        The URL and name are parsed once per version and shared by all of the stages of the pipeline.
+
+        :parameter version: The version of the database.
+
+        :returns: The URL and name of the file.
+        """
+
+        if version.startswith("v_building_blocks_"):
+            file_name = "{file_name_prefix:s}.smi.gz".format(
+                file_name_prefix=version[len("v_building_blocks_"):]
+            )
+
+            file_url = "https://files.docking.org/bb/current/{file_name:s}".format(
+                file_name=file_name
+            )
+
+        elif version.startswith("v_catalog_"):
+            file_name = "{file_name_prefix:s}.src.txt".format(
+                file_name_prefix=version[len("v_catalog_"):]
+            )
+
+            file_url = "https://files.docking.org/catalogs/source/{file_name:s}".format(
+                file_name=file_name
+            )
+
+        else:
+            raise ValueError(
+                "The version '{version:s}' of the ZINC chemical compound database is not supported.".format(
+                    version=version
+                )
+            )
+
+        return file_url, file_name
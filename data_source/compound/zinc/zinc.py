@@ -1,8 +1,13 @@
 """ The ``data_source.compound.zinc`` package ``zinc`` module. """
 
-from os import PathLike
-from re import findall
-from typing import Dict, Union
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from json import dump, load
+from logging import INFO
+from os import PathLike, environ, getpid
+from pathlib import Path
+from re import Pattern, compile as compile_pattern
+from typing import Dict, List, Union
 
 from data_source.base.base import BaseDataSource
 from data_source.base.utility.download import BaseDataSourceDownloadUtility
@@ -10,48 +15,212 @@ from data_source.base.utility.download import BaseDataSourceDownloadUtility
 from data_source.compound.zinc.utility.download import ZINCCompoundDatabaseDownloadUtility
 from data_source.compound.zinc.utility.extraction import ZINCCompoundDatabaseExtractionUtility
 from data_source.compound.zinc.utility.formatting import ZINCCompoundDatabaseFormattingUtility
+from data_source.compound.zinc.utility.version import ZINCCompoundDatabaseVersionUtility
+
+
+V_BUILDING_BLOCKS_HREF_PATTERN = compile_pattern(
+    pattern=rb"href=\"([^\".]+)\.smi\.gz\""
+)
+
+V_CATALOG_HREF_PATTERN = compile_pattern(
+    pattern=rb"href=\"([^\".]+)\.src\.txt\""
+)
+
+DOI_URL = "https://doi.org/10.1021/acs.jcim.0c00675"
+
+V_VERSION_PATTERN = compile_pattern(
+    pattern=r"^v_(building_blocks|catalog)_[A-Za-z0-9._-]+$"
+)
 
 
 class ZINCCompoundDatabase(BaseDataSource):
     """ The `ZINC <https://zinc20.docking.org>`_ chemical compound database class. """
 
+    @staticmethod
+    def _find_file_name_prefixes(
+            html_content: bytes,
+            href_pattern: Pattern[bytes]
+    ) -> List[str]:
+        """
+        Find the prefixes of the file names linked from an HTML index page.
+
+        The links are matched once in the raw content of the page, without decoding it, using a pattern that is
+        anchored at both quotes of the `href` attribute and excludes the dotted file name prefixes.
+
+        :parameter html_content: The raw content of the HTML index page.
+        :parameter href_pattern: The pattern of the `href` attributes, capturing the prefixes of the file names.
+
+        :returns: The prefixes of the file names.
+        """
+
+        return [
+            file_name_prefix.decode() for file_name_prefix in href_pattern.findall(html_content)
+        ]
+
+    @staticmethod
+    def _find_cached_file_name_prefixes(
+            http_get_request_url: str,
+            href_pattern: Pattern[bytes],
+            cache_file_name: str
+    ) -> List[str]:
+        """
+        Find the prefixes of the file names linked from an HTML index page using an on-disk cache.
+
+        The page is requested conditionally using the `ETag` and `Last-Modified` values of the cached response, so an
+        unchanged page is neither transferred nor parsed again. The cache file that cannot be read or does not hold
+        the prefixes of the file names is ignored.
+
+        :parameter http_get_request_url: The URL of the HTML index page.
+        :parameter href_pattern: The pattern of the `href` attributes, capturing the prefixes of the file names.
+        :parameter cache_file_name: The name of the cache file.
+
+        :returns: The prefixes of the file names.
+        """
+
+        # An empty `XDG_CACHE_HOME` environment variable is treated as unset, as required by the XDG specification.
+        cache_file_path = Path(
+            environ.get("XDG_CACHE_HOME", None) or Path.home() / ".cache",
+            "data_source",
+            cache_file_name
+        )
+
+        try:
+            with cache_file_path.open(
+                mode="r"
+            ) as cache_file_handle:
+                cache = load(cache_file_handle)
+
+        except (OSError, ValueError):
+            cache = None
+
+        if not isinstance(cache, dict) or not isinstance(cache.get("file_name_prefixes", None), list):
+            cache = None
+
+        http_get_request_headers = dict()
+
+        if cache is not None:
+            if isinstance(cache.get("etag", None), str):
+                http_get_request_headers["If-None-Match"] = cache["etag"]
+
+            if isinstance(cache.get("last_modified", None), str):
+                http_get_request_headers["If-Modified-Since"] = cache["last_modified"]
+
+        http_get_request_response = BaseDataSourceDownloadUtility.send_http_get_request(
+            http_get_request_url=http_get_request_url,
+            headers=http_get_request_headers
+        )
+
+        if cache is not None and http_get_request_response.status_code == 304:
+            return cache["file_name_prefixes"]
+
+        file_name_prefixes = ZINCCompoundDatabase._find_file_name_prefixes(
+            html_content=http_get_request_response.content,
+            href_pattern=href_pattern
+        )
+
+        cache = {
+            "etag": http_get_request_response.headers.get("ETag", None),
+            "last_modified": http_get_request_response.headers.get("Last-Modified", None),
+            "file_name_prefixes": file_name_prefixes,
+        }
+
+        if cache["etag"] is not None or cache["last_modified"] is not None:
+            try:
+                cache_file_path.parent.mkdir(
+                    parents=True,
+                    exist_ok=True
+                )
+
+                temporary_cache_file_path = cache_file_path.with_name(
+                    "{cache_file_name:s}.{process_id:d}.tmp".format(
+                        cache_file_name=cache_file_name,
+                        process_id=getpid()
+                    )
+                )
+
+                with temporary_cache_file_path.open(
+                    mode="w"
+                ) as cache_file_handle:
+                    dump(cache, cache_file_handle)
+
+                temporary_cache_file_path.replace(
+                    target=cache_file_path
+                )
+
+            except OSError:
+                pass
+
+        return file_name_prefixes
+
+    @staticmethod
+    @lru_cache(
+        maxsize=1
+    )
+    def _fetch_supported_versions() -> Dict[str, str]:
+        """
+        Fetch the supported versions of the database.
+
+        The supported versions are fetched once per process and shared by all of the instances of the class.
+
+        :returns: The supported versions of the database.
+        """
+
+        with ThreadPoolExecutor(
+            max_workers=2
+        ) as thread_pool_executor:
+            building_blocks_future, catalog_future = [
+                thread_pool_executor.submit(
+                    ZINCCompoundDatabase._find_cached_file_name_prefixes,
+                    http_get_request_url=http_get_request_url,
+                    href_pattern=href_pattern,
+                    cache_file_name=cache_file_name
+                ) for http_get_request_url, href_pattern, cache_file_name in [
+                    (
+                        "https://files.docking.org/bb/current",
+                        V_BUILDING_BLOCKS_HREF_PATTERN,
+                        "zinc_building_blocks.json",
+                    ),
+                    (
+                        "https://files.docking.org/catalogs/source",
+                        V_CATALOG_HREF_PATTERN,
+                        "zinc_catalogs.json",
+                    ),
+                ]
+            ]
+
+            building_blocks_file_name_prefixes = building_blocks_future.result()
+
+            catalog_file_name_prefixes = catalog_future.result()
+
+        return {
+            **{
+                "v_building_blocks_{file_name:s}".format(
+                    file_name=file_name
+                ): DOI_URL for file_name in building_blocks_file_name_prefixes
+            },
+            **{
+                "v_catalog_{file_name:s}".format(
+                    file_name=file_name
+                ): DOI_URL for file_name in catalog_file_name_prefixes
+            },
+        }
+
     def get_supported_versions(
             self
     ) -> Dict[str, str]:
         """
         Get the supported versions of the database.
 
+        The fetched supported versions are cached and shared by all of the instances of the class, so a copy of them is
+        returned to the caller.
+
         :returns: The supported versions of the database.
         """
 
         try:
-            supported_versions = dict()
-
-            for file_name in findall(
-                pattern=r"href=\"([^\.]+)\.smi\.gz",
-                string=BaseDataSourceDownloadUtility.send_http_get_request(
-                    http_get_request_url="https://files.docking.org/bb/current"
-                ).text
-            ):
-                supported_versions[
-                    "v_building_blocks_{file_name:s}".format(
-                        file_name=file_name
-                    )
-                ] = "https://doi.org/10.1021/acs.jcim.0c00675"
-
-            for file_name in findall(
-                pattern=r"href=\"([^\.]+)\.src\.txt",
-                string=BaseDataSourceDownloadUtility.send_http_get_request(
-                    http_get_request_url="https://files.docking.org/catalogs/source"
-                ).text
-            ):
-                supported_versions[
-                    "v_catalog_{file_name:s}".format(
-                        file_name=file_name
-                    )
-                ] = "https://doi.org/10.1021/acs.jcim.0c00675"
-
-            return supported_versions
+            return dict(
+                ZINCCompoundDatabase._fetch_supported_versions()
+            )
 
         except Exception as exception_handle:
             if self.logger is not None:
@@ -61,6 +230,24 @@ class ZINCCompoundDatabase(BaseDataSource):
 
             raise
 
+    def _is_supported_version(
+            self,
+            version: str
+    ) -> bool:
+        """
+        Check whether a version of the database is supported.
+
+        The version is only validated against the naming pattern of the supported versions, without retrieving them.
+
+        :parameter version: The version of the database.
+
+        :returns: The indicator of whether the version of the database is supported.
+        """
+
+        return V_VERSION_PATTERN.match(
+            version
+        ) is not None
+
     def download(
             self,
             version: str,
@@ -74,54 +261,73 @@ class ZINCCompoundDatabase(BaseDataSource):
         :parameter output_directory_path: The path to the output directory where the data should be downloaded.
         """
 
-        try:
-            if version in self.get_supported_versions().keys():
-                if self.logger is not None:
-                    self.logger.info(
-                        msg="The download of the data from the {data_source:s} has been started.".format(
-                            data_source="ZINC chemical compound database ({version:s})".format(
-                                version=version
-                            )
-                        )
-                    )
+        self._run_stage(
+            stage_name="download",
+            data_source_name="ZINC chemical compound database ({version:s})".format(
+                version=version
+            ),
+            is_supported=partial(
+                self._is_supported_version,
+                version=version
+            ),
+            stage_function=partial(
+                self._download,
+                version=version,
+                output_directory_path=output_directory_path
+            )
+        )
+
+    @staticmethod
+    def _download(
+            version: str,
+            output_directory_path: Union[str, PathLike[str]]
+    ) -> None:
+        """
+        Download the data from a version of the database.
 
-                if version.startswith("v_building_blocks"):
-                    ZINCCompoundDatabaseDownloadUtility.download_v_building_blocks(
-                        version=version,
-                        output_directory_path=output_directory_path
-                    )
+        :parameter version: The version of the database.
+        :parameter output_directory_path: The path to the output directory where the data should be downloaded.
+        """
 
-                if version.startswith("v_catalog"):
-                    ZINCCompoundDatabaseDownloadUtility.download_v_catalog(
-                        version=version,
-                        output_directory_path=output_directory_path
-                    )
+        if version.startswith("v_building_blocks"):
+            ZINCCompoundDatabaseDownloadUtility.download_v_building_blocks(
+                version=version,
+                output_directory_path=output_directory_path
+            )
 
-                if self.logger is not None:
-                    self.logger.info(
-                        msg="The download of the data from the {data_source:s} has been completed.".format(
-                            data_source="ZINC chemical compound database ({version:s})".format(
-                                version=version
-                            )
-                        )
-                    )
+        if version.startswith("v_catalog"):
+            ZINCCompoundDatabaseDownloadUtility.download_v_catalog(
+                version=version,
+                output_directory_path=output_directory_path
+            )
 
-            else:
-                raise ValueError(
-                    "The download of the data from the {data_source:s} is not supported.".format(
-                        data_source="ZINC chemical compound database ({version:s})".format(
-                            version=version
-                        )
-                    )
-                )
+    def download_many(
+            self,
+            versions: List[str],
+            output_directory_path: Union[str, PathLike[str]],
+            max_workers: int = 8
+    ) -> None:
+        """
+        Download the data from multiple versions of the database concurrently.
 
-        except Exception as exception_handle:
-            if self.logger is not None:
-                self.logger.error(
-                    msg=exception_handle
-                )
+        :parameter versions: The versions of the database.
+        :parameter output_directory_path: The path to the output directory where the data should be downloaded.
+        :parameter max_workers: The maximum number of concurrent downloads.
+        """
 
-            raise
+        with ThreadPoolExecutor(
+            max_workers=max_workers
+        ) as thread_pool_executor:
+            futures = [
+                thread_pool_executor.submit(
+                    self.download,
+                    version=version,
+                    output_directory_path=output_directory_path
+                ) for version in versions
+            ]
+
+            for future in futures:
+                future.result()
 
     def extract(
             self,
@@ -138,49 +344,74 @@ class ZINCCompoundDatabase(BaseDataSource):
         :parameter output_directory_path: The path to the output directory where the data should be extracted.
         """
 
-        try:
-            if version in self.get_supported_versions().keys():
-                if self.logger is not None:
-                    self.logger.info(
-                        msg="The extraction of the data from the {data_source:s} has been started.".format(
-                            data_source="ZINC chemical compound database ({version:s})".format(
-                                version=version
-                            )
-                        )
-                    )
+        self._run_stage(
+            stage_name="extraction",
+            data_source_name="ZINC chemical compound database ({version:s})".format(
+                version=version
+            ),
+            is_supported=partial(
+                self._is_supported_version,
+                version=version
+            ),
+            stage_function=partial(
+                self._extract,
+                version=version,
+                input_directory_path=input_directory_path,
+                output_directory_path=output_directory_path
+            )
+        )
+
+    @staticmethod
+    def _extract(
+            version: str,
+            input_directory_path: Union[str, PathLike[str]],
+            output_directory_path: Union[str, PathLike[str]]
+    ) -> None:
+        """
+        Extract the data from a version of the database.
 
-                if version.startswith("v_building_blocks"):
-                    ZINCCompoundDatabaseExtractionUtility.extract_v_building_blocks(
-                        version=version,
-                        input_directory_path=input_directory_path,
-                        output_directory_path=output_directory_path
-                    )
+        :parameter version: The version of the database.
+        :parameter input_directory_path: The path to the input directory where the data is downloaded.
+        :parameter output_directory_path: The path to the output directory where the data should be extracted.
+        """
 
-                if self.logger is not None:
-                    self.logger.info(
-                        msg="The extraction of the data from the {data_source:s} has been completed.".format(
-                            data_source="ZINC chemical compound database ({version:s})".format(
-                                version=version
-                            )
-                        )
-                    )
+        if version.startswith("v_building_blocks"):
+            ZINCCompoundDatabaseExtractionUtility.extract_v_building_blocks(
+                version=version,
+                input_directory_path=input_directory_path,
+                output_directory_path=output_directory_path
+            )
 
-            else:
-                raise ValueError(
-                    "The extraction of the data from the {data_source:s} is not supported.".format(
-                        data_source="ZINC chemical compound database ({version:s})".format(
-                            version=version
-                        )
-                    )
-                )
+    def extract_many(
+            self,
+            versions: List[str],
+            input_directory_path: Union[str, PathLike[str]],
+            output_directory_path: Union[str, PathLike[str]],
+            max_workers: int = 4
+    ) -> None:
+        """
+        Extract the data from multiple versions of the database concurrently.
 
-        except Exception as exception_handle:
-            if self.logger is not None:
-                self.logger.error(
-                    msg=exception_handle
-                )
+        :parameter versions: The versions of the database.
+        :parameter input_directory_path: The path to the input directory where the data is downloaded.
+        :parameter output_directory_path: The path to the output directory where the data should be extracted.
+        :parameter max_workers: The maximum number of concurrent extractions.
+        """
 
-            raise
+        with ThreadPoolExecutor(
+            max_workers=max_workers
+        ) as thread_pool_executor:
+            futures = [
+                thread_pool_executor.submit(
+                    self.extract,
+                    version=version,
+                    input_directory_path=input_directory_path,
+                    output_directory_path=output_directory_path
+                ) for version in versions
+            ]
+
+            for future in futures:
+                future.result()
 
     def format(
             self,
@@ -195,55 +426,123 @@ class ZINCCompoundDatabase(BaseDataSource):
         :parameter version: The version of the database.
         :parameter input_directory_path: The path to the input directory where the data is extracted.
         :parameter output_directory_path: The path to the output directory where the data should be formatted.
+        :parameter kwargs: The keyword arguments for the adjustment of the output file: { `output_file_format` }, which
+            is either `csv` (default) or `parquet`.
         """
 
-        try:
-            if version in self.get_supported_versions().keys():
-                if self.logger is not None:
-                    self.logger.info(
-                        msg="The formatting of the data from the {data_source:s} has been started.".format(
-                            data_source="ZINC chemical compound database ({version:s})".format(
-                                version=version
-                            )
-                        )
-                    )
+        self._run_stage(
+            stage_name="formatting",
+            data_source_name="ZINC chemical compound database ({version:s})".format(
+                version=version
+            ),
+            is_supported=partial(
+                self._is_supported_version,
+                version=version
+            ),
+            stage_function=partial(
+                self._format,
+                version=version,
+                input_directory_path=input_directory_path,
+                output_directory_path=output_directory_path,
+                output_file_format=kwargs.get("output_file_format", "csv")
+            )
+        )
+
+    @staticmethod
+    def _format(
+            version: str,
+            input_directory_path: Union[str, PathLike[str]],
+            output_directory_path: Union[str, PathLike[str]],
+            output_file_format: str = "csv"
+    ) -> None:
+        """
+        Format the data from a version of the database.
 
-                if version.startswith("v_building_blocks"):
-                    ZINCCompoundDatabaseFormattingUtility.format_v_building_blocks(
-                        version=version,
-                        input_directory_path=input_directory_path,
-                        output_directory_path=output_directory_path
-                    )
+        :parameter version: The version of the database.
+        :parameter input_directory_path: The path to the input directory where the data is extracted.
+        :parameter output_directory_path: The path to the output directory where the data should be formatted.
+        :parameter output_file_format: The format of the output file: { `csv`, `parquet` }.
+        """
 
-                if version.startswith("v_catalog"):
-                    ZINCCompoundDatabaseFormattingUtility.format_v_catalog(
-                        version=version,
-                        input_directory_path=input_directory_path,
-                        output_directory_path=output_directory_path
-                    )
+        if version.startswith("v_building_blocks"):
+            ZINCCompoundDatabaseFormattingUtility.format_v_building_blocks(
+                version=version,
+                input_directory_path=input_directory_path,
+                output_directory_path=output_directory_path,
+                output_file_format=output_file_format
+            )
+
+        if version.startswith("v_catalog"):
+            ZINCCompoundDatabaseFormattingUtility.format_v_catalog(
+                version=version,
+                input_directory_path=input_directory_path,
+                output_directory_path=output_directory_path,
+                output_file_format=output_file_format
+            )
+
+    def _run_pipeline_stages(
+            self,
+            intermediate_directory_path: Union[str, PathLike[str]],
+            output_directory_path: Union[str, PathLike[str]],
+            version: str,
+            **kwargs
+    ) -> None:
+        """
+        Download, extract, and format the data from the database one stage after another.
 
-                if self.logger is not None:
-                    self.logger.info(
-                        msg="The formatting of the data from the {data_source:s} has been completed.".format(
-                            data_source="ZINC chemical compound database ({version:s})".format(
-                                version=version
-                            )
-                        )
-                    )
+        The downloaded `v_building_blocks_*` data is decompressed on the fly, without writing the archive file. The file
+        that is already decompressed into the intermediate directory by an interrupted pipeline is not downloaded again.
+
+        :parameter intermediate_directory_path: The path to the directory where the data should be downloaded and
+            extracted.
+        :parameter output_directory_path: The path to the output directory where the data should be formatted.
+        :parameter version: The version of the database.
+        :parameter kwargs: The keyword arguments for the adjustment of the output file: { `output_file_format` }, which
+            is either `csv` (default) or `parquet`.
+        """
 
-            else:
-                raise ValueError(
-                    "The formatting of the data from the {data_source:s} is not supported.".format(
-                        data_source="ZINC chemical compound database ({version:s})".format(
-                            version=version
-                        )
+        if not version.startswith("v_building_blocks"):
+            super()._run_pipeline_stages(
+                intermediate_directory_path=intermediate_directory_path,
+                output_directory_path=output_directory_path,
+                version=version,
+                **kwargs
+            )
+
+            return
+
+        _, file_name = ZINCCompoundDatabaseVersionUtility.get_file_url_and_name(
+            version=version
+        )
+
+        if Path(intermediate_directory_path, file_name[:-3]).is_file():
+            if self.logger is not None and self.logger.isEnabledFor(INFO):
+                self.logger.info(
+                    msg="The '{file_name:s}' file is already decompressed, so it is not downloaded again.".format(
+                        file_name=file_name[:-3]
                     )
                 )
 
-        except Exception as exception_handle:
-            if self.logger is not None:
-                self.logger.error(
-                    msg=exception_handle
+        else:
+            self._run_stage(
+                stage_name="streamed download and extraction",
+                data_source_name="ZINC chemical compound database ({version:s})".format(
+                    version=version
+                ),
+                is_supported=partial(
+                    self._is_supported_version,
+                    version=version
+                ),
+                stage_function=partial(
+                    ZINCCompoundDatabaseDownloadUtility.download_and_extract_v_building_blocks,
+                    version=version,
+                    output_directory_path=intermediate_directory_path
                 )
+            )
 
-            raise
+        self.format(
+            version=version,
+            input_directory_path=intermediate_directory_path,
+            output_directory_path=output_directory_path,
+            **kwargs
+        )
@@ -0,0 +1,19 @@
+""" The ``data_source`` package ``names`` module. """
+
+# The names are kept apart from the data source classes, so that they can be listed without importing the data source
+# packages, which load the heavy chemistry libraries.
+SUPPORTED_DATA_SOURCE_NAMES = {
+    "compound": [
+        "chembl",
+        "miscellaneous",
+        "zinc",
+    ],
+    "reaction": [
+        "crd",
+        "miscellaneous",
+        "ord",
+        "retro_rules",
+        "rhea",
+        "uspto",
+    ],
+}
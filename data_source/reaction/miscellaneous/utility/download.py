@@ -44,14 +44,17 @@ class MiscellaneousReactionDataSourceDownloadUtility:
             "https://raw.githubusercontent.com/jnwei/neural_reaction_fingerprint/master/data/test_questions/Wade8_48.ans_smi.txt",
         ]
 
-        for file_url in file_urls:
-            BaseDataSourceDownloadUtility.download_file(
-                file_url=file_url,
-                file_name=file_url.split(
-                    sep="/"
-                )[-1],
-                output_directory_path=output_directory_path
-            )
+        BaseDataSourceDownloadUtility.download_files(
+            file_urls_and_names=[
+                (
+                    file_url,
+                    file_url.split(
+                        sep="/"
+                    )[-1],
+                ) for file_url in file_urls
+            ],
+            output_directory_path=output_directory_path
+        )
 
     @staticmethod
     def download_v_retro_transform_db_by_20180421_avramova_s_et_al(
@@ -128,14 +131,17 @@ class MiscellaneousReactionDataSourceDownloadUtility:
                 )
             )
 
-        for file_url in file_urls:
-            BaseDataSourceDownloadUtility.download_file(
-                file_url=file_url,
-                file_name=file_url.split(
-                    sep="/"
-                )[-1],
-                output_directory_path=output_directory_path
-            )
+        BaseDataSourceDownloadUtility.download_files(
+            file_urls_and_names=[
+                (
+                    file_url,
+                    file_url.split(
+                        sep="/"
+                    )[-1],
+                ) for file_url in file_urls
+            ],
+            output_directory_path=output_directory_path
+        )
 
     @staticmethod
     def download_v_golden_dataset_by_20211102_lin_a_et_al(
@@ -174,14 +180,17 @@ class MiscellaneousReactionDataSourceDownloadUtility:
             "https://zenodo.org/records/6618262/files/ccsdtf12_tz.csv",
         ]
 
-        for file_url in file_urls:
-            BaseDataSourceDownloadUtility.download_file(
-                file_url=file_url,
-                file_name=file_url.split(
-                    sep="/"
-                )[-1],
-                output_directory_path=output_directory_path
-            )
+        BaseDataSourceDownloadUtility.download_files(
+            file_urls_and_names=[
+                (
+                    file_url,
+                    file_url.split(
+                        sep="/"
+                    )[-1],
+                ) for file_url in file_urls
+            ],
+            output_directory_path=output_directory_path
+        )
 
     @staticmethod
     def download_v_orderly(
@@ -248,9 +257,7 @@ class MiscellaneousReactionDataSourceDownloadUtility:
                 )
             )
 
-        for file_url, file_name in file_urls_and_names:
-            BaseDataSourceDownloadUtility.download_file(
-                file_url=file_url,
-                file_name=file_name,
-                output_directory_path=output_directory_path
-            )
+        BaseDataSourceDownloadUtility.download_files(
+            file_urls_and_names=file_urls_and_names,
+            output_directory_path=output_directory_path
+        )
@@ -1,5 +1,6 @@
 """ The ``data_source.reaction.ord`` package ``ord`` module. """
 
+from functools import partial
 from os import PathLike
 from typing import Dict, Union
 
@@ -8,6 +9,7 @@ from data_source.base.base import BaseDataSource
 from data_source.reaction.ord.utility.download import OpenReactionDatabaseDownloadUtility
 from data_source.reaction.ord.utility.extraction import OpenReactionDatabaseExtractionUtility
 from data_source.reaction.ord.utility.formatting import OpenReactionDatabaseFormattingUtility
+from data_source.reaction.ord.utility.version import V_RELEASE_ARCHIVES
 
 
 class OpenReactionDatabase(BaseDataSource):
@@ -22,10 +24,23 @@ class OpenReactionDatabase(BaseDataSource):
         """
 
         return {
-            "v_release_0_1_0": "https://doi.org/10.1021/jacs.1c09820",
-            "v_release_main": "https://doi.org/10.1021/jacs.1c09820",
+            version: "https://doi.org/10.1021/jacs.1c09820" for version in V_RELEASE_ARCHIVES.keys()
         }
 
+    @staticmethod
+    def _is_supported_version(
+            version: str
+    ) -> bool:
+        """
+        Check whether a version of the chemical reaction database is supported.
+
+        :parameter version: The version of the chemical reaction database.
+
+        :returns: The indicator of whether the version of the chemical reaction database is supported.
+        """
+
+        return version in V_RELEASE_ARCHIVES
+
     def download(
             self,
             version: str,
@@ -39,51 +54,21 @@ class OpenReactionDatabase(BaseDataSource):
         :parameter output_directory_path: The path to the output directory where the data should be downloaded.
         """
 
-        try:
-            if version in self.get_supported_versions().keys():
-                if self.logger is not None:
-                    self.logger.info(
-                        msg="The download of the data from the {data_source:s} has been started.".format(
-                            data_source="Open Reaction Database ({version:s})".format(
-                                version=version
-                            )
-                        )
-                    )
-
-                if version in [
-                    "v_release_0_1_0",
-                    "v_release_main",
-                ]:
-                    OpenReactionDatabaseDownloadUtility.download_v_release(
-                        version=version,
-                        output_directory_path=output_directory_path
-                    )
-
-                if self.logger is not None:
-                    self.logger.info(
-                        msg="The download of the data from the {data_source:s} has been completed.".format(
-                            data_source="Open Reaction Database ({version:s})".format(
-                                version=version
-                            )
-                        )
-                    )
-
-            else:
-                raise ValueError(
-                    "The download of the data from the {data_source:s} is not supported.".format(
-                        data_source="Open Reaction Database ({version:s})".format(
-                            version=version
-                        )
-                    )
-                )
-
-        except Exception as exception_handle:
-            if self.logger is not None:
-                self.logger.error(
-                    msg=exception_handle
-                )
-
-            raise
+        self._run_stage(
+            stage_name="download",
+            data_source_name="Open Reaction Database ({version:s})".format(
+                version=version
+            ),
+            is_supported=partial(
+                self._is_supported_version,
+                version=version
+            ),
+            stage_function=partial(
+                OpenReactionDatabaseDownloadUtility.download_v_release,
+                version=version,
+                output_directory_path=output_directory_path
+            )
+        )
 
     def extract(
             self,
@@ -101,52 +86,22 @@ class OpenReactionDatabase(BaseDataSource):
         :parameter kwargs: The keyword arguments.
         """
 
-        try:
-            if version in self.get_supported_versions().keys():
-                if self.logger is not None:
-                    self.logger.info(
-                        msg="The extraction of the data from the {data_source:s} has been started.".format(
-                            data_source="Open Reaction Database ({version:s})".format(
-                                version=version
-                            )
-                        )
-                    )
-
-                if version in [
-                    "v_release_0_1_0",
-                    "v_release_main",
-                ]:
-                    OpenReactionDatabaseExtractionUtility.extract_v_release(
-                        version=version,
-                        input_directory_path=input_directory_path,
-                        output_directory_path=output_directory_path
-                    )
-
-                if self.logger is not None:
-                    self.logger.info(
-                        msg="The extraction of the data from the {data_source:s} has been completed.".format(
-                            data_source="Open Reaction Database ({version:s})".format(
-                                version=version
-                            )
-                        )
-                    )
-
-            else:
-                raise ValueError(
-                    "The extraction of the data from the {data_source:s} is not supported.".format(
-                        data_source="Open Reaction Database ({version:s})".format(
-                            version=version
-                        )
-                    )
-                )
-
-        except Exception as exception_handle:
-            if self.logger is not None:
-                self.logger.error(
-                    msg=exception_handle
-                )
-
-            raise
+        self._run_stage(
+            stage_name="extraction",
+            data_source_name="Open Reaction Database ({version:s})".format(
+                version=version
+            ),
+            is_supported=partial(
+                self._is_supported_version,
+                version=version
+            ),
+            stage_function=partial(
+                OpenReactionDatabaseExtractionUtility.extract_v_release,
+                version=version,
+                input_directory_path=input_directory_path,
+                output_directory_path=output_directory_path
+            )
+        )
 
     def format(
             self,
@@ -164,50 +119,20 @@ class OpenReactionDatabase(BaseDataSource):
         :parameter kwargs: The keyword arguments.
         """
 
-        try:
-            if version in self.get_supported_versions().keys():
-                if self.logger is not None:
-                    self.logger.info(
-                        msg="The formatting of the data from the {data_source:s} has been started.".format(
-                            data_source="Open Reaction Database ({version:s})".format(
-                                version=version
-                            )
-                        )
-                    )
-
-                if version in [
-                    "v_release_0_1_0",
-                    "v_release_main",
-                ]:
-                    OpenReactionDatabaseFormattingUtility.format_v_release(
-                        version=version,
-                        input_directory_path=input_directory_path,
-                        output_directory_path=output_directory_path,
-                        **kwargs
-                    )
-
-                if self.logger is not None:
-                    self.logger.info(
-                        msg="The formatting of the data from the {data_source:s} has been completed.".format(
-                            data_source="Open Reaction Database ({version:s})".format(
-                                version=version
-                            )
-                        )
-                    )
-
-            else:
-                raise ValueError(
-                    "The formatting of the data from the {data_source:s} is not supported.".format(
-                        data_source="Open Reaction Database ({version:s})".format(
-                            version=version
-                        )
-                    )
-                )
-
-        except Exception as exception_handle:
-            if self.logger is not None:
-                self.logger.error(
-                    msg=exception_handle
-                )
-
-            raise
+        self._run_stage(
+            stage_name="formatting",
+            data_source_name="Open Reaction Database ({version:s})".format(
+                version=version
+            ),
+            is_supported=partial(
+                self._is_supported_version,
+                version=version
+            ),
+            stage_function=partial(
+                OpenReactionDatabaseFormattingUtility.format_v_release,
+                version=version,
+                input_directory_path=input_directory_path,
+                output_directory_path=output_directory_path,
+                **kwargs
+            )
+        )
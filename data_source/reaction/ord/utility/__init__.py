@@ -5,3 +5,5 @@ from data_source.reaction.ord.utility.download import OpenReactionDatabaseDownlo
 from data_source.reaction.ord.utility.extraction import OpenReactionDatabaseExtractionUtility
 
 from data_source.reaction.ord.utility.formatting import OpenReactionDatabaseFormattingUtility
+
+from data_source.reaction.ord.utility.version import OpenReactionDatabaseVersionUtility
@@ -5,6 +5,8 @@ from typing import Union
 
 from data_source.base.utility.download import BaseDataSourceDownloadUtility
 
+from data_source.reaction.ord.utility.version import OpenReactionDatabaseVersionUtility
+
 
 class OpenReactionDatabaseDownloadUtility:
     """ The `Open Reaction Database (ORD) <https://open-reaction-database.org>`_ download utility class. """
@@ -21,24 +23,13 @@ class OpenReactionDatabaseDownloadUtility:
         :parameter output_directory_path: The path to the output directory where the data should be downloaded.
         """
 
-        if version == "v_release_0_1_0":
-            file_url = "https://github.com/open-reaction-database/ord-data/archive/refs/tags/v0.1.0.zip"
-
-            file_name = "ord-data-0.1.0.zip"
-
-        elif version == "v_release_main":
-            file_url = "https://github.com/open-reaction-database/ord-data/archive/refs/heads/main.zip"
-
-            file_name = "ord-data-main.zip"
+        file_url, archive_name = OpenReactionDatabaseVersionUtility.get_v_release_archive_url_and_name(
+            version=version
+        )
 
-        else:
-            raise ValueError(
-                "The download of the data from the {data_source:s} is not supported.".format(
-                    data_source="Open Reaction Database ({version:s})".format(
-                        version=version
-                    )
-                )
-            )
+        file_name = "{archive_name:s}.zip".format(
+            archive_name=archive_name
+        )
 
         BaseDataSourceDownloadUtility.download_file(
             file_url=file_url,
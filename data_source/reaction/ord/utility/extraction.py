@@ -4,7 +4,9 @@ from os import PathLike
 from pathlib import Path
 from typing import Union
 
-from zipfile import ZipFile
+from data_source.base.utility.extraction import BaseDataSourceExtractionUtility
+
+from data_source.reaction.ord.utility.version import OpenReactionDatabaseVersionUtility
 
 
 class OpenReactionDatabaseExtractionUtility:
@@ -19,29 +21,23 @@ class OpenReactionDatabaseExtractionUtility:
         """
         Extract the data from a `v_release_*` version of the database.
 
+        The members of the zip archive file are extracted in parallel.
+
         :parameter version: The version of the database.
         :parameter input_directory_path: The path to the input directory where the data is downloaded.
         :parameter output_directory_path: The path to the output directory where the data should be extracted.
         """
 
-        if version == "v_release_0_1_0":
-            input_file_name = "ord-data-0.1.0.zip"
-
-        elif version == "v_release_main":
-            input_file_name = "ord-data-main.zip"
+        _, archive_name = OpenReactionDatabaseVersionUtility.get_v_release_archive_url_and_name(
+            version=version
+        )
 
-        else:
-            raise ValueError(
-                "The extraction of the data from the {data_source:s} is not supported.".format(
-                    data_source="Open Reaction Database ({version:s})".format(
-                        version=version
-                    )
+        BaseDataSourceExtractionUtility.extract_zip_archive_file(
+            input_file_path=Path(
+                input_directory_path,
+                "{archive_name:s}.zip".format(
+                    archive_name=archive_name
                 )
-            )
-
-        with ZipFile(
-            file=Path(input_directory_path, input_file_name)
-        ) as zip_archive_file_handle:
-            zip_archive_file_handle.extractall(
-                path=output_directory_path
-            )
+            ),
+            output_directory_path=output_directory_path
+        )
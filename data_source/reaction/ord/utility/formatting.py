@@ -1,144 +1,556 @@
 """ The ``data_source.reaction.ord.utility`` package ``formatting`` module. """
 
+from csv import writer
 from datetime import datetime
-from os import PathLike, walk
+from functools import partial
+from io import BytesIO, StringIO
+from multiprocessing import Pool
+from os import DirEntry, PathLike, scandir
 from pathlib import Path
-from typing import List, Optional, Tuple, Union
+from typing import Iterable, Iterator, Optional, Set, Tuple, Union
+from zlib import error as ZlibError
 
-from ord_schema.message_helpers import get_reaction_smiles, load_message
+from ord_schema.message_helpers import get_reaction_smiles, split_cxsmiles_extension
 from ord_schema.proto.dataset_pb2 import Dataset
+from ord_schema.proto.reaction_pb2 import Reaction
 
-from pandas.io.parsers.readers import DataFrame
+from pyarrow import Table, schema, string
+from pyarrow.csv import ConvertOptions, ParseOptions, ReadOptions, read_csv
 
-from pqdm.processes import pqdm
+from google.protobuf.message import DecodeError
 
+from rdkit.Chem.rdChemReactions import ReactionFromSmarts, ReactionToSmiles
 from rdkit.RDLogger import DisableLog
 
+from tqdm.auto import tqdm
+
+from data_source.base.utility.extraction import BaseDataSourceExtractionUtility
+from data_source.base.utility.formatting import SUPPORTED_OUTPUT_FILE_FORMATS, BaseDataSourceFormattingUtility
+
+from data_source.reaction.ord.utility.version import OpenReactionDatabaseVersionUtility
+
+
+NUMBER_OF_CHUNKS_PER_PROCESS = 8
+
+V_RELEASE_COLUMN_NAMES = [
+    "dataset_id",
+    "reaction_id",
+    "reaction_smiles",
+    "file_name",
+]
+
+V_RELEASE_RECORD_BATCH_BUFFER_SIZE = 1 << 26
+
+V_RELEASE_WRITE_BUFFER_SIZE = 1 << 20
+
 
 class OpenReactionDatabaseFormattingUtility:
     """ The `Open Reaction Database (ORD) <https://open-reaction-database.org>`_ formatting utility class. """
 
+    @staticmethod
+    def _initialize_parsing_process() -> None:
+        """
+        Initialize a process that parses the files of the database.
+
+        The `ord_schema` protocol buffer descriptors and the `rdkit` library are already loaded at this point, either
+        inherited from the parent process or imported together with this module, so only the logging is adjusted.
+        """
+
+        DisableLog(
+            spec="rdApp.*"
+        )
+
+    @staticmethod
+    def _get_reaction_smiles(
+            reaction_protocol_buffer_message: Reaction,
+            generate_missing_reaction_smiles: bool = True,
+            canonicalize_reaction_smiles: bool = False
+    ) -> Optional[str]:
+        """
+        Get the reaction SMILES string of a reaction from the database.
+
+        A stored reaction SMILES or CXSMILES identifier of the reaction is retrieved by the `ord_schema` library without
+        invoking the `rdkit` library, which is only used to generate a missing one. If the reaction SMILES string should
+        be canonicalized, it is parsed and written again by the `rdkit` library, and the CXSMILES extension, if any, is
+        dropped, since its atom indices do not survive the reordering of the atoms.
+
+        :parameter reaction_protocol_buffer_message: The protocol buffer message of the reaction.
+        :parameter generate_missing_reaction_smiles: The indicator of whether the missing reaction SMILES string should
+            be generated from the inputs and outcomes of the reaction using the `rdkit` library.
+        :parameter canonicalize_reaction_smiles: The indicator of whether the reaction SMILES string should be
+            canonicalized using the `rdkit` library.
+
+        :returns: The reaction SMILES string of the reaction. The value `None` indicates that the reaction SMILES string
+            is not available.
+
+        :raises ValueError: If the reaction SMILES string cannot be generated or canonicalized.
+        """
+
+        reaction_smiles = get_reaction_smiles(
+            message=reaction_protocol_buffer_message,
+            generate_if_missing=generate_missing_reaction_smiles
+        )
+
+        if reaction_smiles is None or not canonicalize_reaction_smiles:
+            return reaction_smiles
+
+        reaction_smiles, _ = split_cxsmiles_extension(
+            value=reaction_smiles
+        )
+
+        return ReactionToSmiles(
+            ReactionFromSmarts(
+                reaction_smiles,
+                useSmiles=True
+            )
+        )
+
+    @staticmethod
+    def _iterate_v_release_file_rows(
+            dataset_protocol_buffer_message: Dataset,
+            input_file_name: str,
+            generate_missing_reaction_smiles: bool = True,
+            canonicalize_reaction_smiles: bool = False
+    ) -> Iterator[Tuple[str, str, Optional[str], str]]:
+        """
+        Iterate over the rows of a parsed file from a `v_release_*` version of the database.
+
+        The reactions whose reaction SMILES strings cannot be generated or canonicalized are skipped. The retrieval
+        function is bound to a local variable, so that it is not looked up again for each of the reactions.
+
+        :parameter dataset_protocol_buffer_message: The protocol buffer message of the dataset.
+        :parameter input_file_name: The name of the input file.
+        :parameter generate_missing_reaction_smiles: The indicator of whether the missing reaction SMILES strings should
+            be generated from the inputs and outcomes of the reactions using the `rdkit` library.
+        :parameter canonicalize_reaction_smiles: The indicator of whether the reaction SMILES strings should be
+            canonicalized using the `rdkit` library.
+
+        :returns: The rows of the parsed input file.
+        """
+
+        dataset_id = dataset_protocol_buffer_message.dataset_id
+
+        get_reaction_smiles_of = OpenReactionDatabaseFormattingUtility._get_reaction_smiles
+
+        for reaction_protocol_buffer_message in dataset_protocol_buffer_message.reactions:
+            try:
+                reaction_smiles = get_reaction_smiles_of(
+                    reaction_protocol_buffer_message=reaction_protocol_buffer_message,
+                    generate_missing_reaction_smiles=generate_missing_reaction_smiles,
+                    canonicalize_reaction_smiles=canonicalize_reaction_smiles
+                )
+
+            except ValueError:
+                continue
+
+            yield dataset_id, reaction_protocol_buffer_message.reaction_id, reaction_smiles, input_file_name
+
     @staticmethod
     def _parse_v_release_file(
-            input_file_path: Union[str, PathLike[str]]
-    ) -> List[Tuple[Optional[str], ...]]:
+            input_file_path: str,
+            generate_missing_reaction_smiles: bool = True,
+            canonicalize_reaction_smiles: bool = False
+    ) -> bytes:
         """
         Parse a file from a `v_release_*` version of the database.
 
+        The input file is decompressed using the `isal` library, if available, and parsed directly as a binary dataset
+        message. The rows of the parsed input file are encoded into a single block of CSV lines, so that they are
+        transferred from the parsing process as one buffer instead of as many small objects. A corrupted or truncated
+        input file yields only the rows that are written before the error.
+
         :parameter input_file_path: The path to the input file.
+        :parameter generate_missing_reaction_smiles: The indicator of whether the missing reaction SMILES strings should
+            be generated from the inputs and outcomes of the reactions using the `rdkit` library.
+        :parameter canonicalize_reaction_smiles: The indicator of whether the reaction SMILES strings should be
+            canonicalized using the `rdkit` library.
 
-        :returns: The parsed input file.
+        :returns: The CSV lines of the parsed input file.
         """
 
-        parsed_input_file = list()
+        parsed_input_file = StringIO()
+
+        csv_writer = writer(
+            parsed_input_file,
+            lineterminator="\n"
+        )
 
-        # noinspection PyBroadException
         try:
-            dataset_protocol_buffer_message = load_message(
-                filename=input_file_path,
-                message_type=Dataset
+            with BaseDataSourceExtractionUtility.open_gzip_archive_file(
+                input_file=input_file_path
+            ) as gzip_archive_file_handle:
+                # A new message is parsed for each of the files, since clearing and reusing a message is slower than
+                # allocating a new one with the `upb` backend of the `protobuf` library.
+                dataset_protocol_buffer_message = Dataset.FromString(
+                    gzip_archive_file_handle.read()
+                )
+
+            csv_writer.writerows(
+                OpenReactionDatabaseFormattingUtility._iterate_v_release_file_rows(
+                    dataset_protocol_buffer_message=dataset_protocol_buffer_message,
+                    input_file_name=input_file_path.split(
+                        sep="/"
+                    )[-1],
+                    generate_missing_reaction_smiles=generate_missing_reaction_smiles,
+                    canonicalize_reaction_smiles=canonicalize_reaction_smiles
+                )
+            )
+
+            return parsed_input_file.getvalue().encode()
+
+        except (DecodeError, EOFError, OSError, ZlibError):
+            return parsed_input_file.getvalue().encode()
+
+    @staticmethod
+    def _iterate_v_release_file_entries(
+            directory_path: Union[str, PathLike[str]]
+    ) -> Iterator[DirEntry]:
+        """
+        Iterate over the entries of the files from a `v_release_*` version of the database.
+
+        The directory tree is traversed using the `os.scandir` function, so that the type of each entry is read from
+        the directory listing instead of from a separate `stat` call.
+
+        :parameter directory_path: The path to the directory of the files.
+
+        :returns: The iterator of the entries of the files.
+        """
+
+        with scandir(
+            directory_path
+        ) as directory_entries:
+            for directory_entry in directory_entries:
+                if directory_entry.is_dir(
+                    follow_symlinks=False
+                ):
+                    yield from OpenReactionDatabaseFormattingUtility._iterate_v_release_file_entries(
+                        directory_path=directory_entry.path
+                    )
+
+                elif directory_entry.name.endswith(".pb.gz"):
+                    yield directory_entry
+
+    @staticmethod
+    def _find_v_release_output_file_path(
+            version: str,
+            output_directory_path: Union[str, PathLike[str]],
+            output_file_format: str = "csv"
+    ) -> Optional[Path]:
+        """
+        Find the path to the latest output file from a `v_release_*` version of the database, if any.
+
+        :parameter version: The version of the database.
+        :parameter output_directory_path: The path to the output directory where the data is formatted.
+        :parameter output_file_format: The format of the output file: { `csv`, `parquet` }.
+
+        :returns: The path to the latest output file, if any.
+        """
+
+        # The names of the output files start with a timestamp, so the latest output file is sorted last.
+        return max(
+            Path(output_directory_path).glob(
+                pattern="*_ord_{version:s}.{output_file_format:s}".format(
+                    version=version,
+                    output_file_format=output_file_format
+                )
+            ),
+            default=None
+        )
+
+    @staticmethod
+    def _resume_v_release_csv_file(
+            output_file_path: Path
+    ) -> Set[str]:
+        """
+        Prepare an interrupted CSV output file from a `v_release_*` version of the database to be resumed.
+
+        The rows of each of the parsed input files are written as one contiguous block, so only the block of the last
+        input file in the output file can be incomplete. Since a complete block cannot be told apart from one that is
+        interrupted between two lines, the block of the last input file is always truncated from the output file,
+        together with an incomplete last line, if any, and its input file is parsed again. An output file without a
+        complete header line is truncated entirely.
+
+        :parameter output_file_path: The path to the output file.
+
+        :returns: The names of the input files that are already completely written to the output file.
+        """
+
+        input_file_names = list()
+
+        last_input_file_offset = 0
+
+        with open(
+            file=output_file_path,
+            mode="r+b"
+        ) as output_file_handle:
+            header_line = output_file_handle.readline()
+
+            if header_line.endswith(b"\n"):
+                last_input_file_offset = output_file_handle.tell()
+
+                offset = last_input_file_offset
+
+                for line in output_file_handle:
+                    # The last line is incomplete, so it belongs to the block of the last input file regardless of
+                    # the input file name that it ends with.
+                    if not line.endswith(b"\n"):
+                        break
+
+                    input_file_name = line.rstrip(b"\n").rsplit(
+                        sep=b",",
+                        maxsplit=1
+                    )[-1].decode()
+
+                    if not input_file_names or input_file_names[-1] != input_file_name:
+                        input_file_names.append(input_file_name)
+
+                        last_input_file_offset = offset
+
+                    offset += len(line)
+
+                input_file_names = input_file_names[:-1]
+
+            output_file_handle.truncate(
+                last_input_file_offset
             )
 
-            for reaction_protocol_buffer_message in dataset_protocol_buffer_message.reactions:
-                # noinspection PyBroadException
-                try:
-                    parsed_input_file.append((
-                        dataset_protocol_buffer_message.dataset_id,
-                        reaction_protocol_buffer_message.reaction_id,
-                        get_reaction_smiles(
-                            message=reaction_protocol_buffer_message,
-                            generate_if_missing=True,
-                            canonical=False
-                        ),
-                        input_file_path.split(
-                            sep="/"
-                        )[-1],
-                    ))
-
-                except:
-                    continue
-
-            return parsed_input_file
-
-        except:
-            return parsed_input_file
+        return set(input_file_names)
+
+    @staticmethod
+    def _write_v_release_csv_file(
+            parsed_input_files: Iterable[bytes],
+            output_file_path: Path,
+            resume: bool = False
+    ) -> None:
+        """
+        Write the parsed files from a `v_release_*` version of the database to a CSV file.
+
+        The CSV lines of the parsed input files are written through a large write buffer, so that the many small
+        blocks are coalesced into few system calls.
+
+        :parameter parsed_input_files: The CSV lines of the parsed input files.
+        :parameter output_file_path: The path to the output file.
+        :parameter resume: The indicator of whether the CSV lines should be appended to an existing output file.
+        """
+
+        is_appended = resume and output_file_path.is_file() and output_file_path.stat().st_size > 0
+
+        with open(
+            file=output_file_path,
+            mode="ab" if is_appended else "wb",
+            buffering=V_RELEASE_WRITE_BUFFER_SIZE
+        ) as output_file_handle:
+            if not is_appended:
+                output_file_handle.write(
+                    "{header:s}\n".format(
+                        header=",".join(V_RELEASE_COLUMN_NAMES)
+                    ).encode()
+                )
+
+            for parsed_input_file in parsed_input_files:
+                output_file_handle.write(
+                    parsed_input_file
+                )
+
+    @staticmethod
+    def _write_v_release_parquet_file(
+            parsed_input_files: Iterable[bytes],
+            output_file_path: Path
+    ) -> None:
+        """
+        Write the parsed files from a `v_release_*` version of the database to a Parquet file.
+
+        The CSV lines of the parsed input files are buffered and converted by the `pyarrow` library in large blocks, so
+        that each row group of the output file spans many input files.
+
+        :parameter parsed_input_files: The CSV lines of the parsed input files.
+        :parameter output_file_path: The path to the output file.
+        """
+
+        output_schema = schema([
+            (column_name, string()) for column_name in V_RELEASE_COLUMN_NAMES
+        ])
+
+        with BaseDataSourceFormattingUtility.open_output_file_writer(
+            output_file_path=output_file_path,
+            output_schema=output_schema,
+            output_file_format="parquet"
+        ) as output_file_writer:
+            parsed_input_file_buffer = bytearray()
+
+            for parsed_input_file in parsed_input_files:
+                parsed_input_file_buffer += parsed_input_file
+
+                if len(parsed_input_file_buffer) >= V_RELEASE_RECORD_BATCH_BUFFER_SIZE:
+                    output_file_writer.write_table(
+                        table=OpenReactionDatabaseFormattingUtility._convert_v_release_csv_lines(
+                            csv_lines=parsed_input_file_buffer
+                        )
+                    )
+
+                    parsed_input_file_buffer.clear()
+
+            if len(parsed_input_file_buffer) > 0:
+                output_file_writer.write_table(
+                    table=OpenReactionDatabaseFormattingUtility._convert_v_release_csv_lines(
+                        csv_lines=parsed_input_file_buffer
+                    )
+                )
+
+    @staticmethod
+    def _convert_v_release_csv_lines(
+            csv_lines: bytearray
+    ) -> Table:
+        """
+        Convert the CSV lines of the parsed files from a `v_release_*` version of the database into a table.
+
+        :parameter csv_lines: The CSV lines of the parsed input files.
+
+        :returns: The table of the parsed input files.
+        """
+
+        return read_csv(
+            input_file=BytesIO(csv_lines),
+            read_options=ReadOptions(
+                column_names=V_RELEASE_COLUMN_NAMES
+            ),
+            parse_options=ParseOptions(
+                newlines_in_values=True
+            ),
+            convert_options=ConvertOptions(
+                column_types={
+                    column_name: string() for column_name in V_RELEASE_COLUMN_NAMES
+                },
+                strings_can_be_null=True,
+                quoted_strings_can_be_null=False
+            )
+        )
 
     @staticmethod
     def format_v_release(
             version: str,
             input_directory_path: Union[str, PathLike[str]],
             output_directory_path: Union[str, PathLike[str]],
-            number_of_processes: int = 1
+            number_of_processes: int = 1,
+            output_file_format: str = "csv",
+            generate_missing_reaction_smiles: bool = True,
+            canonicalize_reaction_smiles: bool = False,
+            resume: bool = False,
+            chunksize: Optional[int] = None
     ) -> None:
         """
         Format the data from a `v_release_*` version of the database.
 
+        The files are distributed to the parsing processes in chunks, from the largest to the smallest, so that each
+        process receives several files at once and the results are collected in the order in which they are completed.
+
         :parameter version: The version of the database.
         :parameter input_directory_path: The path to the input directory where the data is extracted.
         :parameter output_directory_path: The path to the output directory where the data should be formatted.
         :parameter number_of_processes: The number of processes.
+        :parameter output_file_format: The format of the output file: { `csv`, `parquet` }.
+        :parameter generate_missing_reaction_smiles: The indicator of whether the missing reaction SMILES strings should
+            be generated from the inputs and outcomes of the reactions using the `rdkit` library.
+        :parameter canonicalize_reaction_smiles: The indicator of whether the reaction SMILES strings should be
+            canonicalized using the `rdkit` library.
+        :parameter resume: The indicator of whether the latest output file of an interrupted run should be resumed
+            instead of parsing all of the files again. Only the CSV output file format can be resumed.
+        :parameter chunksize: The number of files in each of the chunks. The value `None` indicates that the files
+            should be split into several chunks per process.
         """
 
-        if version == "v_release_0_1_0":
-            input_directory_name = "ord-data-0.1.0"
-
-        elif version == "v_release_main":
-            input_directory_name = "ord-data-main"
+        if output_file_format not in SUPPORTED_OUTPUT_FILE_FORMATS:
+            raise ValueError(
+                "The output file format '{output_file_format:s}' is not supported.".format(
+                    output_file_format=output_file_format
+                )
+            )
 
-        else:
+        # The footer of a Parquet file is only written once the file is closed, so an interrupted Parquet output file
+        # cannot be read back, let alone appended to.
+        if resume and output_file_format != "csv":
             raise ValueError(
-                "The formatting of the data from the {data_source:s} is not supported.".format(
-                    data_source="Open Reaction Database ({version:s})".format(
-                        version=version
-                    )
+                "The output file format '{output_file_format:s}' cannot be resumed.".format(
+                    output_file_format=output_file_format
                 )
             )
 
-        output_file_name = "{timestamp:s}_ord_{version:s}.csv".format(
-            timestamp=datetime.now().strftime(
-                format="%Y%m%d%H%M%S"
-            ),
+        _, input_directory_name = OpenReactionDatabaseVersionUtility.get_v_release_archive_url_and_name(
             version=version
         )
 
-        file_paths = list()
+        output_file_path, parsed_input_file_names = None, set()
 
-        for directory_path, _, file_names in walk(
-            top=Path(input_directory_path, input_directory_name, "data")
-        ):
-            for file_name in file_names:
-                if file_name.endswith(".pb.gz"):
-                    file_paths.append(
-                        Path(directory_path, file_name).resolve().as_posix()
-                    )
+        if resume:
+            output_file_path = OpenReactionDatabaseFormattingUtility._find_v_release_output_file_path(
+                version=version,
+                output_directory_path=output_directory_path,
+                output_file_format=output_file_format
+            )
 
-        DisableLog(
-            spec="rdApp.*"
-        )
+            if output_file_path is not None:
+                parsed_input_file_names = OpenReactionDatabaseFormattingUtility._resume_v_release_csv_file(
+                    output_file_path=output_file_path
+                )
 
-        dataframe_rows = list()
-
-        for reaction_data in pqdm(
-            array=file_paths,
-            function=OpenReactionDatabaseFormattingUtility._parse_v_release_file,
-            n_jobs=number_of_processes,
-            desc="Parsing the files",
-            total=len(file_paths),
-            ncols=150
-        ):
-            dataframe_rows.extend(
-                reaction_data
+        if output_file_path is None:
+            timestamp = datetime.now().strftime(
+                format="%Y%m%d%H%M%S"
             )
 
-        DataFrame(
-            data=dataframe_rows,
-            columns=[
-                "dataset_id",
-                "reaction_id",
-                "reaction_smiles",
-                "file_name",
-            ]
-        ).to_csv(
-            path_or_buf=Path(output_directory_path, output_file_name),
-            index=False
-        )
+            output_file_path = Path(
+                output_directory_path,
+                "{timestamp:s}_ord_{version:s}.{output_file_format:s}".format(
+                    timestamp=timestamp,
+                    version=version,
+                    output_file_format=output_file_format
+                )
+            )
+
+        # The largest files are dispatched first, so that none of them is left to a single process at the end.
+        file_paths = [
+            Path(file_entry.path).as_posix() for file_entry in sorted(
+                OpenReactionDatabaseFormattingUtility._iterate_v_release_file_entries(
+                    directory_path=Path(input_directory_path, input_directory_name, "data")
+                ),
+                key=lambda file_entry: file_entry.stat().st_size,
+                reverse=True
+            ) if file_entry.name not in parsed_input_file_names
+        ]
+
+        with Pool(
+            processes=number_of_processes,
+            initializer=OpenReactionDatabaseFormattingUtility._initialize_parsing_process
+        ) as process_pool:
+            parsed_input_files = tqdm(
+                iterable=process_pool.imap_unordered(
+                    partial(
+                        OpenReactionDatabaseFormattingUtility._parse_v_release_file,
+                        generate_missing_reaction_smiles=generate_missing_reaction_smiles,
+                        canonicalize_reaction_smiles=canonicalize_reaction_smiles
+                    ),
+                    file_paths,
+                    chunksize=chunksize if chunksize is not None else max(
+                        1, len(file_paths) // (number_of_processes * NUMBER_OF_CHUNKS_PER_PROCESS)
+                    )
+                ),
+                desc="Parsing the files into '{output_file_name:s}'".format(
+                    output_file_name=output_file_path.name
+                ),
+                total=len(file_paths),
+                ncols=150,
+                disable=None
+            )
+
+            if output_file_format == "parquet":
+                OpenReactionDatabaseFormattingUtility._write_v_release_parquet_file(
+                    parsed_input_files=parsed_input_files,
+                    output_file_path=output_file_path
+                )
+
+            else:
+                OpenReactionDatabaseFormattingUtility._write_v_release_csv_file(
+                    parsed_input_files=parsed_input_files,
+                    output_file_path=output_file_path,
+                    resume=resume
+                )
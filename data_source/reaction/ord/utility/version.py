@@ -0,0 +1,42 @@
+""" The ``data_source.reaction.ord.utility`` package ``version`` module. """
+
+from typing import Tuple
+
+
+V_RELEASE_ARCHIVES = {
+    "v_release_0_1_0": (
+        "https://github.com/open-reaction-database/ord-data/archive/refs/tags/v0.1.0.zip",
+        "ord-data-0.1.0",
+    ),
+    "v_release_main": (
+        "https://github.com/open-reaction-database/ord-data/archive/refs/heads/main.zip",
+        "ord-data-main",
+    ),
+}
+
+
+class OpenReactionDatabaseVersionUtility:
+    """ The `Open Reaction Database (ORD) <https://open-reaction-database.org>`_ version utility class. """
+
+    @staticmethod
+    def get_v_release_archive_url_and_name(
+            version: str
+    ) -> Tuple[str, str]:
+        """
+        Get the URL and name of the archive from a `v_release_*` version of the database.
+
+        The name of the archive is also the name of the top-level directory of its content.
+
+        :parameter version: The version of the database.
+
+        :returns: The URL and name of the archive.
+        """
+
+        if version not in V_RELEASE_ARCHIVES:
+            raise ValueError(
+                "The version '{version:s}' of the Open Reaction Database is not supported.".format(
+                    version=version
+                )
+            )
+
+        return V_RELEASE_ARCHIVES[version]
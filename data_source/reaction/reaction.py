@@ -5,6 +5,7 @@ from os import PathLike
 from typing import Dict, List, Optional, Union
 
 from data_source.base.base import BaseDataSource
+from data_source.names import SUPPORTED_DATA_SOURCE_NAMES
 
 from data_source.reaction.crd.crd import ChemicalReactionDatabase
 from data_source.reaction.miscellaneous.miscellaneous import MiscellaneousReactionDataSource
@@ -14,6 +15,16 @@ from data_source.reaction.rhea.rhea import RheaReactionDatabase
 from data_source.reaction.uspto.uspto import USPTOReactionDataset
 
 
+SUPPORTED_DATA_SOURCE_CLASSES = {
+    "crd": ChemicalReactionDatabase,
+    "miscellaneous": MiscellaneousReactionDataSource,
+    "ord": OpenReactionDatabase,
+    "retro_rules": RetroRulesReactionDatabase,
+    "rhea": RheaReactionDatabase,
+    "uspto": USPTOReactionDataset,
+}
+
+
 class ReactionDataSource(BaseDataSource):
     """ The chemical reaction data source class. """
 
@@ -32,36 +43,22 @@ class ReactionDataSource(BaseDataSource):
         )
 
         self.supported_data_sources = {
-            "crd": ChemicalReactionDatabase(
-                logger=logger
-            ),
-            "miscellaneous": MiscellaneousReactionDataSource(
-                logger=logger
-            ),
-            "ord": OpenReactionDatabase(
-                logger=logger
-            ),
-            "retro_rules": RetroRulesReactionDatabase(
-                logger=logger
-            ),
-            "rhea": RheaReactionDatabase(
+            name: data_source_class(
                 logger=logger
-            ),
-            "uspto": USPTOReactionDataset(
-                logger=logger
-            ),
+            ) for name, data_source_class in SUPPORTED_DATA_SOURCE_CLASSES.items()
         }
 
-    def get_names_of_supported_data_sources(
-            self
-    ) -> List[str]:
+    @staticmethod
+    def get_names_of_supported_data_sources() -> List[str]:
         """
         Get the names of the supported data sources.
 
+        The names are available without constructing or even importing any of the data sources.
+
         :returns: The names of the supported data sources.
         """
 
-        return list(self.supported_data_sources.keys())
+        return list(SUPPORTED_DATA_SOURCE_NAMES["reaction"])
 
     def get_supported_versions(
             self,
@@ -203,3 +200,39 @@ class ReactionDataSource(BaseDataSource):
                 )
 
             raise exception_handle
+
+    def run_pipeline(
+            self,
+            name: str,
+            version: str,
+            output_directory_path: Union[str, PathLike[str]],
+            **kwargs
+    ) -> None:
+        """
+        Download, extract, and format the data from a data source.
+
+        :parameter name: The name of the data source.
+        :parameter version: The version of the data source.
+        :parameter output_directory_path: The path to the output directory where the data should be formatted.
+        """
+
+        if name in self.get_names_of_supported_data_sources():
+            self.supported_data_sources[name].run_pipeline(
+                version=version,
+                output_directory_path=output_directory_path,
+                **kwargs
+            )
+
+        else:
+            exception_handle = ValueError(
+                "The chemical reaction data source name '{name:s}' is not supported.".format(
+                    name=name
+                )
+            )
+
+            if self.logger is not None:
+                self.logger.error(
+                    msg=exception_handle
+                )
+
+            raise exception_handle
@@ -2,11 +2,12 @@
 
 from os import PathLike
 from pathlib import Path
-from shutil import copyfileobj
 from typing import Union
 
 from tarfile import TarFile
 
+from data_source.base.utility.extraction import BaseDataSourceExtractionUtility
+
 
 class RetroRulesReactionDatabaseExtractionUtility:
     """ The `RetroRules <https://retrorules.org>`_ chemical reaction database extraction utility class. """
@@ -82,7 +83,7 @@ class RetroRulesReactionDatabaseExtractionUtility:
                     mode="wb"
                 ) as destination_file_handle:
                     # noinspection PyTypeChecker
-                    copyfileobj(
-                        fsrc=source_file_handle,
-                        fdst=destination_file_handle
+                    BaseDataSourceExtractionUtility.copy_file_handle(
+                        source_file_handle=source_file_handle,
+                        destination_file_handle=destination_file_handle
                     )
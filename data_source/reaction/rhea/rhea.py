@@ -1,47 +1,77 @@
 """ The ``data_source.reaction.rhea`` package ``rhea`` module. """
 
+from functools import partial
+from logging import INFO, Logger
 from os import PathLike
-from re import search
-from typing import Dict, Union
+from pathlib import Path
+from re import compile as compile_pattern
+from typing import Dict, Optional, Union
 
 from data_source.base.base import BaseDataSource
 from data_source.base.utility.download import BaseDataSourceDownloadUtility
 
 from data_source.reaction.rhea.utility.download import RheaReactionDatabaseDownloadUtility
-from data_source.reaction.rhea.utility.extraction import RheaReactionDatabaseExtractionUtility
+from data_source.reaction.rhea.utility.extraction import (
+    V_RELEASE_EXTRACTED_FILE_NAME,
+    RheaReactionDatabaseExtractionUtility,
+)
 from data_source.reaction.rhea.utility.formatting import RheaReactionDatabaseFormattingUtility
 
 
+LATEST_RELEASE_NUMBER_PATTERN = compile_pattern(
+    pattern=rb"rhea\.release\.number=(\d+)"
+)
+
+V_RELEASE_VERSION_PATTERN = compile_pattern(
+    pattern=r"v_release_(\d+)"
+)
+
+
 class RheaReactionDatabase(BaseDataSource):
     """ The `Rhea <https://www.rhea-db.org>`_ chemical reaction database class. """
 
-    def get_supported_versions(
+    def __init__(
+            self,
+            logger: Optional[Logger] = None
+    ) -> None:
+        """
+        The constructor method of the class.
+
+        :parameter logger: The logger. The value `None` indicates that the logger should not be utilized.
+        """
+
+        super().__init__(
+            logger=logger
+        )
+
+        self.__latest_release_number = None
+
+    def _get_latest_release_number(
             self
-    ) -> Dict[str, str]:
+    ) -> int:
         """
-        Get the supported versions of the chemical reaction database.
+        Get the latest release number of the chemical reaction database.
 
-        :returns: The supported versions of the chemical reaction database.
+        The latest release number is retrieved once per instance and reused afterwards.
+
+        :returns: The latest release number of the chemical reaction database.
         """
 
+        if self.__latest_release_number is not None:
+            return self.__latest_release_number
+
         try:
             http_get_request_response = BaseDataSourceDownloadUtility.send_http_get_request(
                 http_get_request_url="https://ftp.expasy.org/databases/rhea/rhea-release.properties"
             )
 
-            latest_release_number = int(
-                search(
-                    pattern=r"rhea\.release\.number=(\d+)",
-                    string=str(http_get_request_response.content)
+            self.__latest_release_number = int(
+                LATEST_RELEASE_NUMBER_PATTERN.search(
+                    http_get_request_response.content
                 ).group(1)
             )
 
-            return {
-                "v_release_{release_number:d}".format(
-                    release_number=release_number
-                ): "https://doi.org/10.1093/nar/gkab1016"
-                for release_number in range(126, latest_release_number + 1)
-            }
+            return self.__latest_release_number
 
         except Exception as exception_handle:
             if self.logger is not None:
@@ -51,6 +81,40 @@ class RheaReactionDatabase(BaseDataSource):
 
             raise
 
+    def _is_supported_version(
+            self,
+            version: str
+    ) -> bool:
+        """
+        Check whether a version of the chemical reaction database is supported.
+
+        :parameter version: The version of the chemical reaction database.
+
+        :returns: The indicator of whether the version of the chemical reaction database is supported.
+        """
+
+        version_match = V_RELEASE_VERSION_PATTERN.fullmatch(
+            version
+        )
+
+        return version_match is not None and 126 <= int(version_match.group(1)) <= self._get_latest_release_number()
+
+    def get_supported_versions(
+            self
+    ) -> Dict[str, str]:
+        """
+        Get the supported versions of the chemical reaction database.
+
+        :returns: The supported versions of the chemical reaction database.
+        """
+
+        return {
+            "v_release_{release_number:d}".format(
+                release_number=release_number
+            ): "https://doi.org/10.1093/nar/gkab1016"
+            for release_number in range(126, self._get_latest_release_number() + 1)
+        }
+
     def download(
             self,
             version: str,
@@ -64,48 +128,21 @@ class RheaReactionDatabase(BaseDataSource):
         :parameter output_directory_path: The path to the output directory where the data should be downloaded.
         """
 
-        try:
-            if version in self.get_supported_versions().keys():
-                if self.logger is not None:
-                    self.logger.info(
-                        msg="The download of the data from the {data_source:s} has been started.".format(
-                            data_source="Rhea chemical reaction database ({version:s})".format(
-                                version=version
-                            )
-                        )
-                    )
-
-                if version.startswith("v_release"):
-                    RheaReactionDatabaseDownloadUtility.download_v_release(
-                        version=version,
-                        output_directory_path=output_directory_path
-                    )
-
-                if self.logger is not None:
-                    self.logger.info(
-                        msg="The download of the data from the {data_source:s} has been completed.".format(
-                            data_source="Rhea chemical reaction database ({version:s})".format(
-                                version=version
-                            )
-                        )
-                    )
-
-            else:
-                raise ValueError(
-                    "The download of the data from the {data_source:s} is not supported.".format(
-                        data_source="Rhea chemical reaction database ({version:s})".format(
-                            version=version
-                        )
-                    )
-                )
-
-        except Exception as exception_handle:
-            if self.logger is not None:
-                self.logger.error(
-                    msg=exception_handle
-                )
-
-            raise
+        self._run_stage(
+            stage_name="download",
+            data_source_name="Rhea chemical reaction database ({version:s})".format(
+                version=version
+            ),
+            is_supported=partial(
+                self._is_supported_version,
+                version=version
+            ),
+            stage_function=partial(
+                RheaReactionDatabaseDownloadUtility.download_v_release,
+                version=version,
+                output_directory_path=output_directory_path
+            )
+        )
 
     def extract(
             self,
@@ -122,49 +159,22 @@ class RheaReactionDatabase(BaseDataSource):
         :parameter output_directory_path: The path to the output directory where the data should be extracted.
         """
 
-        try:
-            if version in self.get_supported_versions().keys():
-                if self.logger is not None:
-                    self.logger.info(
-                        msg="The extraction of the data from the {data_source:s} has been started.".format(
-                            data_source="Rhea chemical reaction database ({version:s})".format(
-                                version=version
-                            )
-                        )
-                    )
-
-                if version.startswith("v_release"):
-                    RheaReactionDatabaseExtractionUtility.extract_v_release(
-                        version=version,
-                        input_directory_path=input_directory_path,
-                        output_directory_path=output_directory_path
-                    )
-
-                if self.logger is not None:
-                    self.logger.info(
-                        msg="The extraction of the data from the {data_source:s} has been completed.".format(
-                            data_source="Rhea chemical reaction database ({version:s})".format(
-                                version=version
-                            )
-                        )
-                    )
-
-            else:
-                raise ValueError(
-                    "The extraction of the data from the {data_source:s} is not supported.".format(
-                        data_source="Rhea chemical reaction database ({version:s})".format(
-                            version=version
-                        )
-                    )
-                )
-
-        except Exception as exception_handle:
-            if self.logger is not None:
-                self.logger.error(
-                    msg=exception_handle
-                )
-
-            raise
+        self._run_stage(
+            stage_name="extraction",
+            data_source_name="Rhea chemical reaction database ({version:s})".format(
+                version=version
+            ),
+            is_supported=partial(
+                self._is_supported_version,
+                version=version
+            ),
+            stage_function=partial(
+                RheaReactionDatabaseExtractionUtility.extract_v_release,
+                version=version,
+                input_directory_path=input_directory_path,
+                output_directory_path=output_directory_path
+            )
+        )
 
     def format(
             self,
@@ -181,46 +191,68 @@ class RheaReactionDatabase(BaseDataSource):
         :parameter output_directory_path: The path to the output directory where the data should be formatted.
         """
 
-        try:
-            if version in self.get_supported_versions().keys():
-                if self.logger is not None:
-                    self.logger.info(
-                        msg="The formatting of the data from the {data_source:s} has been started.".format(
-                            data_source="Rhea chemical reaction database ({version:s})".format(
-                                version=version
-                            )
-                        )
-                    )
+        self._run_stage(
+            stage_name="formatting",
+            data_source_name="Rhea chemical reaction database ({version:s})".format(
+                version=version
+            ),
+            is_supported=partial(
+                self._is_supported_version,
+                version=version
+            ),
+            stage_function=partial(
+                RheaReactionDatabaseFormattingUtility.format_v_release,
+                version=version,
+                input_directory_path=input_directory_path,
+                output_directory_path=output_directory_path
+            )
+        )
 
-                if version.startswith("v_release"):
-                    RheaReactionDatabaseFormattingUtility.format_v_release(
-                        version=version,
-                        input_directory_path=input_directory_path,
-                        output_directory_path=output_directory_path
-                    )
+    def _run_pipeline_stages(
+            self,
+            intermediate_directory_path: Union[str, PathLike[str]],
+            output_directory_path: Union[str, PathLike[str]],
+            version: str,
+            **kwargs
+    ) -> None:
+        """
+        Download, extract, and format the data from the chemical reaction database one stage after another.
 
-                if self.logger is not None:
-                    self.logger.info(
-                        msg="The formatting of the data from the {data_source:s} has been completed.".format(
-                            data_source="Rhea chemical reaction database ({version:s})".format(
-                                version=version
-                            )
-                        )
-                    )
+        The downloaded data is extracted on the fly, without writing the archive file. The file that is already
+        extracted into the intermediate directory by an interrupted pipeline is not downloaded again.
+
+        :parameter intermediate_directory_path: The path to the directory where the data should be extracted.
+        :parameter output_directory_path: The path to the output directory where the data should be formatted.
+        :parameter version: The version of the chemical reaction database.
+        """
 
-            else:
-                raise ValueError(
-                    "The formatting of the data from the {data_source:s} is not supported.".format(
-                        data_source="Rhea chemical reaction database ({version:s})".format(
-                            version=version
-                        )
+        if Path(intermediate_directory_path, V_RELEASE_EXTRACTED_FILE_NAME).is_file():
+            if self.logger is not None and self.logger.isEnabledFor(INFO):
+                self.logger.info(
+                    msg="The '{file_name:s}' file is already extracted, so it is not downloaded again.".format(
+                        file_name=V_RELEASE_EXTRACTED_FILE_NAME
                     )
                 )
 
-        except Exception as exception_handle:
-            if self.logger is not None:
-                self.logger.error(
-                    msg=exception_handle
+        else:
+            self._run_stage(
+                stage_name="streamed download and extraction",
+                data_source_name="Rhea chemical reaction database ({version:s})".format(
+                    version=version
+                ),
+                is_supported=partial(
+                    self._is_supported_version,
+                    version=version
+                ),
+                stage_function=partial(
+                    RheaReactionDatabaseDownloadUtility.download_and_extract_v_release,
+                    version=version,
+                    output_directory_path=intermediate_directory_path
                 )
+            )
 
-            raise
+        self.format(
+            version=version,
+            input_directory_path=intermediate_directory_path,
+            output_directory_path=output_directory_path
+        )
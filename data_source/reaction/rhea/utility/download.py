@@ -5,6 +5,8 @@ from typing import Union
 
 from data_source.base.utility.download import BaseDataSourceDownloadUtility
 
+from data_source.reaction.rhea.utility.extraction import RheaReactionDatabaseExtractionUtility
+
 
 class RheaReactionDatabaseDownloadUtility:
     """ The `Rhea <https://www.rhea-db.org>`_ chemical reaction database download utility class. """
@@ -34,3 +36,39 @@ class RheaReactionDatabaseDownloadUtility:
             )[-1],
             output_directory_path=output_directory_path
         )
+
+    @staticmethod
+    def download_and_extract_v_release(
+            version: str,
+            output_directory_path: Union[str, PathLike[str]]
+    ) -> None:
+        """
+        Download and extract the data from a `v_release_*` version of the chemical reaction database.
+
+        The downloaded data is extracted on the fly, so the `*.tar.bz2` archive file is never written. The stream is
+        read ahead in a background thread, so that the transfer overlaps with the decompression.
+
+        :parameter version: The version of the chemical reaction database.
+        :parameter output_directory_path: The path to the output directory where the data should be extracted.
+        """
+
+        file_url = "https://ftp.expasy.org/databases/rhea/old_releases/{release_number:s}.tar.bz2".format(
+            release_number=version.split(
+                sep="_"
+            )[-1]
+        )
+
+        with BaseDataSourceDownloadUtility.open_file_stream(
+            file_url=file_url,
+            file_name=file_url.split(
+                sep="/"
+            )[-1]
+        ) as file_stream_handle:
+            with BaseDataSourceDownloadUtility.prefetch_file_stream(
+                file_handle=file_stream_handle
+            ) as prefetched_file_stream_handle:
+                RheaReactionDatabaseExtractionUtility.extract_v_release_stream(
+                    version=version,
+                    input_file_handle=prefetched_file_stream_handle,
+                    output_directory_path=output_directory_path
+                )
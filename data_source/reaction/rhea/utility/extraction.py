@@ -2,11 +2,14 @@
 
 from os import PathLike
 from pathlib import Path
-from shutil import copyfileobj
-from typing import Union
+from typing import BinaryIO, Union
 
 from tarfile import TarFile
 
+from data_source.base.utility.extraction import BaseDataSourceExtractionUtility
+
+
+V_RELEASE_EXTRACTED_FILE_NAME = "rhea-reaction-smiles.tsv"
 
 class RheaReactionDatabaseExtractionUtility:
     """ The `Rhea <https://www.rhea-db.org>`_ chemical reaction database extraction utility class. """
@@ -31,7 +34,7 @@ class RheaReactionDatabaseExtractionUtility:
             )[-1]
         )
 
-        output_file_name = "rhea-reaction-smiles.tsv"
+        output_file_name = V_RELEASE_EXTRACTED_FILE_NAME
 
         with TarFile.open(
             name=Path(input_directory_path, input_file_name),
@@ -50,7 +53,72 @@ class RheaReactionDatabaseExtractionUtility:
                     mode="wb"
                 ) as destination_file_handle:
                     # noinspection PyTypeChecker
-                    copyfileobj(
-                        fsrc=source_file_handle,
-                        fdst=destination_file_handle
+                    BaseDataSourceExtractionUtility.copy_file_handle(
+                        source_file_handle=source_file_handle,
+                        destination_file_handle=destination_file_handle
+                    )
+
+    @staticmethod
+    def extract_v_release_stream(
+            version: str,
+            input_file_handle: BinaryIO,
+            output_directory_path: Union[str, PathLike[str]]
+    ) -> None:
+        """
+        Extract the data from a stream of a `v_release_*` version of the chemical reaction database.
+
+        The tar archive file is read in the streaming mode, so the members are visited in the order in which they are
+        received, and the reading of the stream stops as soon as the relevant member is extracted. The member is
+        extracted into a partial file, which replaces the output file only once it is complete.
+
+        :parameter version: The version of the chemical reaction database.
+        :parameter input_file_handle: The handle of the stream of the `*.tar.bz2` archive file.
+        :parameter output_directory_path: The path to the output directory where the data should be extracted.
+        """
+
+        output_file_name = V_RELEASE_EXTRACTED_FILE_NAME
+
+        member_name = "{release_number:s}/tsv/{output_file_name:s}".format(
+            release_number=version.split(
+                sep="_"
+            )[-1],
+            output_file_name=output_file_name
+        )
+
+        partial_output_file_path = Path(
+            output_directory_path,
+            "{output_file_name:s}.part".format(
+                output_file_name=output_file_name
+            )
+        )
+
+        with TarFile.open(
+            fileobj=input_file_handle,
+            mode="r|bz2"
+        ) as tar_archive_file_handle:
+            for member in tar_archive_file_handle:
+                if member.name == member_name:
+                    with tar_archive_file_handle.extractfile(
+                        member=member
+                    ) as source_file_handle:
+                        with open(
+                            file=partial_output_file_path,
+                            mode="wb"
+                        ) as destination_file_handle:
+                            # noinspection PyTypeChecker
+                            BaseDataSourceExtractionUtility.copy_file_handle(
+                                source_file_handle=source_file_handle,
+                                destination_file_handle=destination_file_handle
+                            )
+
+                    partial_output_file_path.replace(
+                        target=Path(output_directory_path, output_file_name)
                     )
+
+                    return
+
+        raise ValueError(
+            "The member '{member_name:s}' is not found in the archive file.".format(
+                member_name=member_name
+            )
+        )
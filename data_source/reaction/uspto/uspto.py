@@ -350,7 +350,8 @@ class USPTOReactionDataset(BaseDataSource):
                         version=version,
                         input_directory_path=input_directory_path,
                         output_directory_path=output_directory_path,
-                        number_of_processes=kwargs.get("number_of_processes", 1)
+                        number_of_processes=kwargs.get("number_of_processes", 1),
+                        chunksize=kwargs.get("chunksize", None)
                     )
 
                 if version == "v_50k_by_20170905_liu_b_et_al":
@@ -65,12 +65,10 @@ class USPTOReactionDatasetDownloadUtility:
                 )
             )
 
-        for file_url, file_name in file_urls_and_names:
-            BaseDataSourceDownloadUtility.download_file(
-                file_url=file_url,
-                file_name=file_name,
-                output_directory_path=output_directory_path
-            )
+        BaseDataSourceDownloadUtility.download_files(
+            file_urls_and_names=file_urls_and_names,
+            output_directory_path=output_directory_path
+        )
 
     @staticmethod
     def download_v_50k_by_20141226_schneider_n_et_al(
@@ -185,12 +183,10 @@ class USPTOReactionDatasetDownloadUtility:
                 )
             )
 
-        for file_url, file_name in file_urls_and_names:
-            BaseDataSourceDownloadUtility.download_file(
-                file_url=file_url,
-                file_name=file_name,
-                output_directory_path=output_directory_path
-            )
+        BaseDataSourceDownloadUtility.download_files(
+            file_urls_and_names=file_urls_and_names,
+            output_directory_path=output_directory_path
+        )
 
     @staticmethod
     def download_v_50k_by_20170905_liu_b_et_al(
@@ -211,14 +207,17 @@ class USPTOReactionDatasetDownloadUtility:
             "https://raw.githubusercontent.com/pandegroup/reaction_prediction_seq2seq/master/processed_data/test_sources",
         ]
 
-        for file_url in file_urls:
-            BaseDataSourceDownloadUtility.download_file(
-                file_url=file_url,
-                file_name=file_url.split(
-                    sep="/"
-                )[-1],
-                output_directory_path=output_directory_path
-            )
+        BaseDataSourceDownloadUtility.download_files(
+            file_urls_and_names=[
+                (
+                    file_url,
+                    file_url.split(
+                        sep="/"
+                    )[-1],
+                ) for file_url in file_urls
+            ],
+            output_directory_path=output_directory_path
+        )
 
     @staticmethod
     def download_v_50k_by_20171116_coley_c_w_et_al(
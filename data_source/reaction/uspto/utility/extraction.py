@@ -2,7 +2,6 @@
 
 from os import PathLike
 from pathlib import Path
-from shutil import copyfileobj
 from typing import Union
 
 from gzip import GzipFile
@@ -11,6 +10,8 @@ from py7zr.py7zr import SevenZipFile
 
 from zipfile import ZipFile
 
+from data_source.base.utility.extraction import BaseDataSourceExtractionUtility
+
 
 class USPTOReactionDatasetExtractionUtility:
     """
@@ -77,9 +78,9 @@ class USPTOReactionDatasetExtractionUtility:
                         mode="wb"
                     ) as destination_file_handle:
                         # noinspection PyTypeChecker
-                        copyfileobj(
-                            fsrc=source_file_handle,
-                            fdst=destination_file_handle
+                        BaseDataSourceExtractionUtility.copy_file_handle(
+                            source_file_handle=source_file_handle,
+                            destination_file_handle=destination_file_handle
                         )
 
                 if output_file_name.endswith(".gz"):
@@ -91,9 +92,9 @@ class USPTOReactionDatasetExtractionUtility:
                             mode="wb"
                         ) as destination_file_handle:
                             # noinspection PyTypeChecker
-                            copyfileobj(
-                                fsrc=gzip_archive_file_handle,
-                                fdst=destination_file_handle
+                            BaseDataSourceExtractionUtility.copy_file_handle(
+                                source_file_handle=gzip_archive_file_handle,
+                                destination_file_handle=destination_file_handle
                             )
 
     @staticmethod
@@ -129,9 +130,9 @@ class USPTOReactionDatasetExtractionUtility:
                         mode="wb"
                     ) as destination_file_handle:
                         # noinspection PyTypeChecker
-                        copyfileobj(
-                            fsrc=source_file_handle,
-                            fdst=destination_file_handle
+                        BaseDataSourceExtractionUtility.copy_file_handle(
+                            source_file_handle=source_file_handle,
+                            destination_file_handle=destination_file_handle
                         )
 
     @staticmethod
@@ -168,9 +169,9 @@ class USPTOReactionDatasetExtractionUtility:
                         mode="wb"
                     ) as destination_file_handle:
                         # noinspection PyTypeChecker
-                        copyfileobj(
-                            fsrc=source_file_handle,
-                            fdst=destination_file_handle
+                        BaseDataSourceExtractionUtility.copy_file_handle(
+                            source_file_handle=source_file_handle,
+                            destination_file_handle=destination_file_handle
                         )
 
     @staticmethod
@@ -271,9 +272,9 @@ class USPTOReactionDatasetExtractionUtility:
                         mode="wb"
                     ) as destination_file_handle:
                         # noinspection PyTypeChecker
-                        copyfileobj(
-                            fsrc=source_file_handle,
-                            fdst=destination_file_handle
+                        BaseDataSourceExtractionUtility.copy_file_handle(
+                            source_file_handle=source_file_handle,
+                            destination_file_handle=destination_file_handle
                         )
 
     @staticmethod
@@ -329,9 +330,9 @@ class USPTOReactionDatasetExtractionUtility:
                         mode="wb"
                     ) as destination_file_handle:
                         # noinspection PyTypeChecker
-                        copyfileobj(
-                            fsrc=source_file_handle,
-                            fdst=destination_file_handle
+                        BaseDataSourceExtractionUtility.copy_file_handle(
+                            source_file_handle=source_file_handle,
+                            destination_file_handle=destination_file_handle
                         )
 
     @staticmethod
@@ -368,9 +369,9 @@ class USPTOReactionDatasetExtractionUtility:
                         mode="wb"
                     ) as destination_file_handle:
                         # noinspection PyTypeChecker
-                        copyfileobj(
-                            fsrc=source_file_handle,
-                            fdst=destination_file_handle
+                        BaseDataSourceExtractionUtility.copy_file_handle(
+                            source_file_handle=source_file_handle,
+                            destination_file_handle=destination_file_handle
                         )
 
     @staticmethod
@@ -406,9 +407,9 @@ class USPTOReactionDatasetExtractionUtility:
                         mode="wb"
                     ) as destination_file_handle:
                         # noinspection PyTypeChecker
-                        copyfileobj(
-                            fsrc=source_file_handle,
-                            fdst=destination_file_handle
+                        BaseDataSourceExtractionUtility.copy_file_handle(
+                            source_file_handle=source_file_handle,
+                            destination_file_handle=destination_file_handle
                         )
 
                 with GzipFile(
@@ -419,9 +420,9 @@ class USPTOReactionDatasetExtractionUtility:
                         mode="wb"
                     ) as destination_file_handle:
                         # noinspection PyTypeChecker
-                        copyfileobj(
-                            fsrc=gzip_archive_file_handle,
-                            fdst=destination_file_handle
+                        BaseDataSourceExtractionUtility.copy_file_handle(
+                            source_file_handle=gzip_archive_file_handle,
+                            destination_file_handle=destination_file_handle
                         )
 
     @staticmethod
@@ -458,7 +459,7 @@ class USPTOReactionDatasetExtractionUtility:
                         mode="wb"
                     ) as destination_file_handle:
                         # noinspection PyTypeChecker
-                        copyfileobj(
-                            fsrc=source_file_handle,
-                            fdst=destination_file_handle
+                        BaseDataSourceExtractionUtility.copy_file_handle(
+                            source_file_handle=source_file_handle,
+                            destination_file_handle=destination_file_handle
                         )
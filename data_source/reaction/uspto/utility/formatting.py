@@ -1,6 +1,7 @@
 """ The ``data_source.reaction.uspto.utility`` package ``formatting`` module. """
 
 from datetime import datetime
+from multiprocessing import Pool
 from os import PathLike, walk
 from pathlib import Path
 from pickle import load
@@ -9,11 +10,14 @@ from typing import List, Optional, Tuple, Union
 from pandas.core.reshape.concat import concat
 from pandas.io.parsers.readers import DataFrame, read_csv
 
-from pqdm.processes import pqdm
+from tqdm.auto import tqdm
 
 from xml.etree import ElementTree
 
 
+NUMBER_OF_CHUNKS_PER_PROCESS = 8
+
+
 class USPTOReactionDatasetFormattingUtility:
     """
     The `United States Patent and Trademark Office (USPTO) <https://www.repository.cam.ac.uk/handle/1810/244727>`_
@@ -319,15 +323,21 @@ class USPTOReactionDatasetFormattingUtility:
             version: str,
             input_directory_path: Union[str, PathLike[str]],
             output_directory_path: Union[str, PathLike[str]],
-            number_of_processes: int = 1
+            number_of_processes: int = 1,
+            chunksize: Optional[int] = None
     ) -> None:
         """
         Format the data from a `v_1976_to_2016_*_by_20121009_lowe_d_m` version of the dataset.
 
+        The files are distributed to the parsing processes in chunks, so that the many small files are not transferred
+        to and from the processes one by one.
+
         :parameter version: The version of the dataset.
         :parameter input_directory_path: The path to the input directory where the data is extracted.
         :parameter output_directory_path: The path to the output directory where the data should be formatted.
         :parameter number_of_processes: The number of processes.
+        :parameter chunksize: The number of files in each of the chunks. The value `None` indicates that the files
+            should be split into several chunks per process.
         """
 
         if version == "v_1976_to_2016_cml_by_20121009_lowe_d_m":
@@ -348,19 +358,28 @@ class USPTOReactionDatasetFormattingUtility:
                                 Path(directory_path, file_name).resolve().as_posix()
                             )
 
+            if chunksize is None:
+                chunksize = max(1, len(input_file_paths) // (number_of_processes * NUMBER_OF_CHUNKS_PER_PROCESS))
+
             parsed_input_files = list()
 
-            for parsed_input_file in pqdm(
-                array=input_file_paths,
-                function=USPTOReactionDatasetFormattingUtility._parse_v_1976_to_2016_cml_by_20121009_lowe_d_m_file,
-                n_jobs=number_of_processes,
-                desc="Parsing the files",
-                total=len(input_file_paths),
-                ncols=150
-            ):
-                parsed_input_files.extend(
-                    parsed_input_file
-                )
+            with Pool(
+                processes=number_of_processes
+            ) as process_pool:
+                for parsed_input_file in tqdm(
+                    iterable=process_pool.imap(
+                        USPTOReactionDatasetFormattingUtility._parse_v_1976_to_2016_cml_by_20121009_lowe_d_m_file,
+                        input_file_paths,
+                        chunksize=chunksize
+                    ),
+                    desc="Parsing the files",
+                    total=len(input_file_paths),
+                    ncols=150,
+                    disable=None
+                ):
+                    parsed_input_files.extend(
+                        parsed_input_file
+                    )
 
             dataframe = DataFrame(
                 data=parsed_input_files,
@@ -1,20 +1,52 @@
 """ The ``scripts`` package ``download_extract_and_format_data`` script. """
 
-from argparse import ArgumentParser, Namespace
-from datetime import datetime
+from argparse import ArgumentParser, ArgumentTypeError, Namespace
 from logging import Formatter, Logger, StreamHandler, getLogger
+from os import W_OK, X_OK, access, cpu_count
 from pathlib import Path
-from shutil import rmtree
+from sys import exit
+from typing import Optional, Type
 
-from data_source.compound import CompoundDataSource
-from data_source.reaction import ReactionDataSource
+from data_source.base import BaseDataSource
+from data_source.names import SUPPORTED_DATA_SOURCE_NAMES
 
 
-def get_script_arguments() -> Namespace:
+def get_positive_integer(
+        value: str
+) -> int:
     """
-    Get the script arguments.
+    Get a positive integer from a script argument value.
 
-    :returns: The script arguments.
+    :parameter value: The script argument value.
+
+    :returns: The positive integer.
+    """
+
+    try:
+        positive_integer = int(value)
+
+    except ValueError:
+        raise ArgumentTypeError(
+            "The value '{value:s}' is not an integer.".format(
+                value=value
+            )
+        )
+
+    if positive_integer < 1:
+        raise ArgumentTypeError(
+            "The value '{value:s}' is not a positive integer.".format(
+                value=value
+            )
+        )
+
+    return positive_integer
+
+
+def get_argument_parser() -> ArgumentParser:
+    """
+    Get the argument parser of the script.
+
+    :returns: The argument parser of the script.
     """
 
     argument_parser = ArgumentParser()
@@ -75,15 +107,115 @@ def get_script_arguments() -> Namespace:
         help="The path to the output directory where the data should be formatted."
     )
 
+    argument_parser.add_argument(
+        "-sd",
+        "--skip_download",
+        action="store_true",
+        help="The indicator of whether to skip the download and use the data in the input directory instead."
+    )
+
+    argument_parser.add_argument(
+        "-se",
+        "--skip_extraction",
+        action="store_true",
+        help="The indicator of whether to skip the download and the extraction and format the already extracted data "
+             "in the input directory."
+    )
+
+    argument_parser.add_argument(
+        "-idp",
+        "--input_directory_path",
+        default=None,
+        type=str,
+        help="The path to the input directory where the data is already downloaded or extracted, if relevant."
+    )
+
+    argument_parser.add_argument(
+        "-rdp",
+        "--resume_directory_path",
+        default=None,
+        type=str,
+        help="The path to the directory where the data should be downloaded and extracted and kept, so that an "
+             "interrupted run can be resumed, if relevant."
+    )
+
     argument_parser.add_argument(
         "-nop",
         "--number_of_processes",
-        default=1,
-        type=str,
-        help="The number of processes, if relevant."
+        default=max(1, (cpu_count() or 2) - 1),
+        type=get_positive_integer,
+        help="The number of processes, if relevant. The default value is the number of CPUs minus one."
+    )
+
+    argument_parser.add_argument(
+        "-cs",
+        "--chunksize",
+        default=None,
+        type=get_positive_integer,
+        help="The number of files that are sent to each of the processes at once, if relevant."
     )
 
-    return argument_parser.parse_args()
+    return argument_parser
+
+
+# The argument parser holds no state between the parsings, so it is only built once.
+ARGUMENT_PARSER = get_argument_parser()
+
+
+def get_script_arguments() -> Namespace:
+    """
+    Get the script arguments.
+
+    :returns: The script arguments.
+    """
+
+    return ARGUMENT_PARSER.parse_args()
+
+
+def is_writable_directory_path(
+        directory_path: Optional[str]
+) -> bool:
+    """
+    Get the indicator of whether a path points to an existing directory where new files can be created.
+
+    :parameter directory_path: The path to the directory.
+
+    :returns: The indicator of whether the path points to an existing directory where new files can be created.
+    """
+
+    return directory_path is not None and Path(directory_path).is_dir() and access(directory_path, W_OK | X_OK)
+
+
+def get_data_source_class(
+        data_source_category: str
+) -> Type[BaseDataSource]:
+    """
+    Get the data source class of a data source category.
+
+    The data source packages are only imported once they are needed, since importing them loads the heavy chemistry
+    libraries, which is not necessary for parsing the script arguments.
+
+    :parameter data_source_category: The data source category.
+
+    :returns: The data source class.
+    """
+
+    if data_source_category == "compound":
+        from data_source.compound import CompoundDataSource
+
+        return CompoundDataSource
+
+    elif data_source_category == "reaction":
+        from data_source.reaction import ReactionDataSource
+
+        return ReactionDataSource
+
+    else:
+        raise ValueError(
+            "The data source category '{category:s}' is not supported.".format(
+                category=data_source_category
+            )
+        )
 
 
 def get_script_logger() -> Logger:
@@ -123,72 +255,120 @@ def get_script_logger() -> Logger:
     return logger
 
 
-if __name__ == "__main__":
-    script_logger = get_script_logger()
-
-    script_arguments = get_script_arguments()
-
-    if script_arguments.data_source_category == "compound":
-        data_source = CompoundDataSource(
-            logger=script_logger
-        )
+def main(
+        script_logger: Logger
+) -> None:
+    """
+    Run the script.
 
-    elif script_arguments.data_source_category == "reaction":
-        data_source = ReactionDataSource(
-            logger=script_logger
-        )
+    :parameter script_logger: The script logger.
+    """
 
-    else:
-        raise ValueError(
-            "The data source category '{category:s}' is not supported.".format(
-                category=script_arguments.data_source_category
-            )
-        )
+    script_arguments = get_script_arguments()
 
+    # The names are answered before the data source category is resolved, so that its package is not imported.
     if script_arguments.get_data_source_name:
         print(script_arguments.data_source_category)
-        print(data_source.get_names_of_supported_data_sources())
+        print(SUPPORTED_DATA_SOURCE_NAMES[script_arguments.data_source_category])
+
+        return
+
+    data_source_class = get_data_source_class(
+        data_source_category=script_arguments.data_source_category
+    )
 
-    elif script_arguments.get_data_source_version:
+    if script_arguments.get_data_source_version:
         print(script_arguments.data_source_category)
         print(script_arguments.data_source_name)
-        print(data_source.get_supported_versions(
+        print(data_source_class(
+            logger=script_logger
+        ).get_supported_versions(
             name=script_arguments.data_source_name
         ))
 
     else:
-        temporary_output_directory_path = Path(
-            script_arguments.output_directory_path,
-            "{timestamp:s}_temporary_output_directory".format(
-                timestamp=datetime.now().strftime(
-                    format="%Y%m%d%H%M%S"
+        # The output directory is validated before anything is downloaded, instead of once the first file is written.
+        if not is_writable_directory_path(
+            directory_path=script_arguments.output_directory_path
+        ):
+            script_logger.error(
+                msg="The output directory '{output_directory_path:s}' does not exist or is not writable.".format(
+                    output_directory_path=str(script_arguments.output_directory_path)
                 )
             )
-        )
 
-        temporary_output_directory_path.mkdir()
+            exit(2)
 
-        data_source.download(
-            name=script_arguments.data_source_name,
-            version=script_arguments.data_source_version,
-            output_directory_path=temporary_output_directory_path
+        data_source = data_source_class(
+            logger=script_logger
         )
 
-        data_source.extract(
-            name=script_arguments.data_source_name,
-            version=script_arguments.data_source_version,
-            input_directory_path=temporary_output_directory_path,
-            output_directory_path=temporary_output_directory_path
-        )
+        if script_arguments.skip_download or script_arguments.skip_extraction:
+            # The input directory is only written to if the data still needs to be extracted into it.
+            if script_arguments.skip_extraction:
+                is_input_directory_path_valid = script_arguments.input_directory_path is not None and \
+                    Path(script_arguments.input_directory_path).is_dir()
+
+            else:
+                is_input_directory_path_valid = is_writable_directory_path(
+                    directory_path=script_arguments.input_directory_path
+                )
+
+            if not is_input_directory_path_valid:
+                script_logger.error(
+                    msg="The input directory '{input_directory_path:s}' does not exist or is not writable.".format(
+                        input_directory_path=str(script_arguments.input_directory_path)
+                    )
+                )
+
+                exit(2)
+
+            # The data is extracted into the input directory itself, so that it can be formatted again later.
+            if not script_arguments.skip_extraction:
+                data_source.extract(
+                    name=script_arguments.data_source_name,
+                    version=script_arguments.data_source_version,
+                    input_directory_path=script_arguments.input_directory_path,
+                    output_directory_path=script_arguments.input_directory_path
+                )
+
+            data_source.format(
+                name=script_arguments.data_source_name,
+                version=script_arguments.data_source_version,
+                input_directory_path=script_arguments.input_directory_path,
+                output_directory_path=script_arguments.output_directory_path,
+                number_of_processes=script_arguments.number_of_processes,
+                chunksize=script_arguments.chunksize
+            )
+
+        else:
+            # The data sources that can overlap the stages, for example by decompressing or formatting the data while it
+            # is being downloaded, override the pipeline, and the other data sources run the stages in a temporary
+            # directory.
+            data_source.run_pipeline(
+                name=script_arguments.data_source_name,
+                version=script_arguments.data_source_version,
+                output_directory_path=script_arguments.output_directory_path,
+                resume_directory_path=script_arguments.resume_directory_path,
+                number_of_processes=script_arguments.number_of_processes,
+                chunksize=script_arguments.chunksize
+            )
+
 
-        data_source.format(
-            name=script_arguments.data_source_name,
-            version=script_arguments.data_source_version,
-            input_directory_path=temporary_output_directory_path,
-            output_directory_path=script_arguments.output_directory_path,
-            number_of_processes=script_arguments.number_of_processes
+if __name__ == "__main__":
+    script_logger = get_script_logger()
+
+    try:
+        main(
+            script_logger=script_logger
         )
 
-        rmtree(
-            path=temporary_output_directory_path
+    except KeyboardInterrupt:
+        exit(130)
+
+    except Exception:
+        script_logger.exception(
+            msg="The script has failed."
         )
+
+        exit(1)
@@ -0,0 +1,44 @@
+import subprocess
+import sys
+import unittest
+from data_source.names import SUPPORTED_DATA_SOURCE_NAMES
+
+# The modules of the heavy libraries, which should not be loaded to answer the data source name query.
+HEAVY_MODULE_NAMES = ['ord_schema', 'pandas', 'rdkit']
+
+# The script that runs the data source name query and prints the heavy modules that it has loaded.
+NAME_QUERY_SCRIPT = '''
+import sys
+from unittest.mock import patch
+from scripts.download_extract_and_format_data import main
+with patch('sys.argv', ['script_name', '-dsc', sys.argv[1], '-gdsn']):
+    main(script_logger=None)
+print(sorted(name for name in {heavy_module_names} if name in sys.modules))
+'''.format(heavy_module_names=HEAVY_MODULE_NAMES)
+
+class TestDataSourceNames(unittest.TestCase):
+    """Unit tests for the `SUPPORTED_DATA_SOURCE_NAMES` table of the data source names.
+        Tests compare the table with the data source classes of each of the data source categories."""
+
+    def test_names_match_data_source_classes(self):
+        """Test if the names match the data source classes of each of the data source categories."""
+        from data_source.compound.compound import SUPPORTED_DATA_SOURCE_CLASSES as COMPOUND_DATA_SOURCE_CLASSES
+        from data_source.reaction.reaction import SUPPORTED_DATA_SOURCE_CLASSES as REACTION_DATA_SOURCE_CLASSES
+        for category, data_source_classes in [('compound', COMPOUND_DATA_SOURCE_CLASSES),
+                                              ('reaction', REACTION_DATA_SOURCE_CLASSES)]:
+            with self.subTest(category=category):
+                self.assertEqual(SUPPORTED_DATA_SOURCE_NAMES[category], list(data_source_classes.keys()))
+
+    def test_name_query_does_not_load_heavy_modules(self):
+        """Test if the data source name query is answered without loading the heavy libraries."""
+        for category in SUPPORTED_DATA_SOURCE_NAMES:
+            with self.subTest(category=category):
+                completed_process = subprocess.run([sys.executable, '-c', NAME_QUERY_SCRIPT, category],
+                                                   capture_output=True, text=True, check=True)
+                output_lines = completed_process.stdout.splitlines()
+                self.assertEqual(output_lines[0], category)
+                self.assertEqual(output_lines[1], str(SUPPORTED_DATA_SOURCE_NAMES[category]))
+                self.assertEqual(output_lines[-1], '[]')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,59 +2,54 @@ import unittest
 from unittest.mock import patch
 from scripts.download_extract_and_format_data import get_script_arguments
 
+# The valid arguments, the name of the parsed argument, and the expected value of the parsed argument.
+VALID_CASES = [
+    # A valid argument `-dsc compound` is parsed correctly.
+    (['-dsc', 'compound'], 'data_source_category', 'compound'),
+    # A valid argument `-dsc reaction` is parsed correctly.
+    (['-dsc', 'reaction'], 'data_source_category', 'reaction'),
+    # A valid argument `-dsn chembl` is parsed correctly.
+    (['-dsn', 'chembl'], 'data_source_name', 'chembl'),
+    # A valid argument `-gdsn` is parsed correctly.
+    (['-gdsn'], 'get_data_source_name', True),
+    # A valid argument `-gdsv` is parsed correctly.
+    (['-gdsv'], 'get_data_source_version', True),
+    # A valid argument `-odp /some/path` is parsed correctly.
+    (['-odp', '/some/path'], 'output_directory_path', '/some/path'),
+    # A valid argument `-nop 4` sets the number of processes correctly.
+    (['-nop', '4'], 'number_of_processes', 4),
+]
+
+# The invalid arguments, which should make the argument parser exit with the code 2.
+INVALID_CASES = [
+    # An invalid argument `-dsc invalid_category` raises an exception.
+    ['-dsc', 'invalid_category'],
+    # An invalid argument `-dsn unknown_source` raises an exception.
+    ['-dsn', 'unknown_source'],
+    # A non-positive argument `-nop 0` raises an exception.
+    ['-nop', '0'],
+    # An undefined argument raises an exception.
+    ['-unknown', 'value'],
+]
+
 class TestInputArguments(unittest.TestCase):
     """Unit tests for `get_script_arguments()` function in the argument parser.
         Tests are mocked to simulate the command line arguments."""
 
-    def test_valid_data_source_category_compound(self):
-        """Test a valid argument `-dsc compound` is parsed correctly."""
-        with patch('sys.argv', ['script_name', '-dsc', 'compound']):
-            args = get_script_arguments()
-            self.assertEqual(args.data_source_category, 'compound')
-
-    def test_valid_data_source_category_reaction(self):
-        """Test a valid argument `-dsc reaction` is parsed correctly."""
-        with patch('sys.argv', ['script_name', '-dsc', 'reaction']):
-            args = get_script_arguments()
-            self.assertEqual(args.data_source_category, 'reaction')
-
-    def test_invalid_data_source_category(self):
-        """Test if an invalid argument `-dsc invalid_category` will raise an exception."""
-        with patch('sys.argv', ['script_name', '-dsc', 'invalid_category']):
-            with self.assertRaises(SystemExit) as cm:
-                get_script_arguments()
-            self.assertEqual(cm.exception.code, 2) 
-
-    def test_valid_data_source_name(self):
-        """Test a valid argument `-dsn chembl` is parsed correctly."""
-        with patch('sys.argv', ['script_name', '-dsn', 'chembl']):
-            args = get_script_arguments()
-            self.assertEqual(args.data_source_name, 'chembl')
-
-    def test_invalid_data_source_name(self):
-        """Test if an invalid argument `-dsn unknown_source` will raise an exception."""
-        with patch('sys.argv', ['script_name', '-dsn', 'unknown_source']):
-            with self.assertRaises(SystemExit) as cm:
-                get_script_arguments()
-            self.assertEqual(cm.exception.code, 2)
-
-    def test_valid_get_data_source_name(self):
-        """Test a valid argument `-gdsn` is parsed correctly."""
-        with patch('sys.argv', ['script_name', '-gdsn']):
-            args = get_script_arguments()
-            self.assertTrue(args.get_data_source_name)
-
-    def test_valid_get_data_source_version(self):
-        """Test a valid argument `-gdsv` is parsed correctly."""
-        with patch('sys.argv', ['script_name', '-gdsv']):
-            args = get_script_arguments()
-            self.assertTrue(args.get_data_source_version)
-
-    def test_valid_output_directory_path(self):
-        """Test a valid argument `-odp /some/path` is parsed correctly."""
-        with patch('sys.argv', ['script_name', '-odp', '/some/path']):
-            args = get_script_arguments()
-            self.assertEqual(args.output_directory_path, '/some/path')
+    def test_valid_arguments(self):
+        """Test if the valid arguments are parsed correctly."""
+        for argv, attribute_name, expected_value in VALID_CASES:
+            with self.subTest(argv=argv), patch('sys.argv', ['script_name'] + argv):
+                args = get_script_arguments()
+                self.assertEqual(getattr(args, attribute_name), expected_value)
+
+    def test_invalid_arguments(self):
+        """Test if the invalid arguments raise an exception."""
+        for argv in INVALID_CASES:
+            with self.subTest(argv=argv), patch('sys.argv', ['script_name'] + argv):
+                with self.assertRaises(SystemExit) as cm:
+                    get_script_arguments()
+                self.assertEqual(cm.exception.code, 2)
 
     def test_missing_required_arguments(self):
         """Test if missing required arguments raises an exception."""
@@ -63,12 +58,6 @@ class TestInputArguments(unittest.TestCase):
                 get_script_arguments()
             self.assertEqual(cm.exception.code, 2)
 
-    def test_valid_number_of_processes(self):
-        """Test if argument `-odp 4` sets number of processes correctly."""
-        with patch('sys.argv', ['script_name', '-nop', '4']):
-            args = get_script_arguments()
-            self.assertEqual(args.number_of_processes, '4')
-
     def test_empty_input(self):
         """ Test if no arguments are passed, it raises an exception."""
         with patch('sys.argv', ['script_name']):
@@ -83,13 +72,6 @@ class TestInputArguments(unittest.TestCase):
                 get_script_arguments()
             self.assertEqual(cm.exception.code, 2)
 
-    def test_undefined_argument_input(self):
-        """Test if an undefined argument raises an exception."""
-        with patch('sys.argv', ['script_name', '-unknown', 'value']):
-            with self.assertRaises(SystemExit) as cm:
-                get_script_arguments()
-            self.assertEqual(cm.exception.code, 2)
-
     def test_extra_spaces_in_arguments(self):
         """Test if extra spaces in arguments could be handled. like `-dsc    compound   ` """
         with patch('sys.argv', ['script_name', '-dsc', '   compound   ']):
@@ -97,4 +79,4 @@ class TestInputArguments(unittest.TestCase):
             self.assertEqual(args.data_source_category.strip(), 'compound')
 
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()
@@ -0,0 +1,44 @@
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from data_source.reaction.ord.utility.formatting import OpenReactionDatabaseFormattingUtility
+
+HEADER_LINE = b'dataset_id,reaction_id,reaction_smiles,file_name\n'
+
+# The blocks of rows of the parsed input files `a.pb.gz` and `b.pb.gz`.
+FIRST_BLOCK = b'ord_dataset-1,ord-1,CCO>>CC=O,a.pb.gz\nord_dataset-1,ord-2,CC>>C=C,a.pb.gz\n'
+LAST_BLOCK = b'ord_dataset-2,ord-3,CN>>C=N,b.pb.gz\n'
+
+# The content of the output file, the expected names of the completely written input files, and the expected content of
+# the output file after it is prepared to be resumed.
+CASES = [
+    # A clean output file always has the block of its last input file truncated.
+    (HEADER_LINE + FIRST_BLOCK + LAST_BLOCK, {'a.pb.gz'}, HEADER_LINE + FIRST_BLOCK),
+    # A partial last line is truncated together with the block of the last complete input file.
+    (HEADER_LINE + FIRST_BLOCK + LAST_BLOCK + b'ord_dataset-3,ord-4,C', {'a.pb.gz'}, HEADER_LINE + FIRST_BLOCK),
+    # A partial first line of the last input file is truncated together with the block of the input file before it.
+    (HEADER_LINE + FIRST_BLOCK + LAST_BLOCK[:-10], set(), HEADER_LINE),
+    # A header-only output file is kept as is.
+    (HEADER_LINE, set(), HEADER_LINE),
+    # A partial header line is truncated.
+    (HEADER_LINE[:-10], set(), b''),
+]
+
+class TestResumeVReleaseCsvFile(unittest.TestCase):
+    """Unit tests for `_resume_v_release_csv_file()` function of the ORD formatting utility.
+        Tests are run on the output files written into a temporary directory."""
+
+    def test_resume_v_release_csv_file(self):
+        """Test if the output file is truncated to the completely written input files."""
+        for content, expected_input_file_names, expected_content in CASES:
+            with self.subTest(content=content), TemporaryDirectory() as directory_path:
+                output_file_path = Path(directory_path, 'output.csv')
+                output_file_path.write_bytes(content)
+                input_file_names = OpenReactionDatabaseFormattingUtility._resume_v_release_csv_file(
+                    output_file_path=output_file_path
+                )
+                self.assertEqual(input_file_names, expected_input_file_names)
+                self.assertEqual(output_file_path.read_bytes(), expected_content)
+
+if __name__ == '__main__':
+    unittest.main()